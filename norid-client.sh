@@ -0,0 +1,14 @@
+#!/bin/sh
+# Norid CLI - Send kommandoer til en kjørende «norid serve»
+# Bruk: ./norid-client.sh das example.no
+
+SOCK="${NORID_SOCKET:-$HOME/.cache/norid/norid.sock}"
+
+if [ ! -S "$SOCK" ]; then
+    echo "Fant ingen norid-tjeneste på $SOCK. Start den med: norid serve" >&2
+    exit 1
+fi
+
+if [ -t 1 ]; then COLOR=1; else COLOR=0; fi
+
+printf '%s\0' "$COLOR" "$#" "$@" | nc -U "$SOCK"
@@ -12,22 +12,49 @@ Tjenester:
 Ingen autentisering kreves for disse tjenestene.
 """
 
+import importlib.util
+import io
 import json
+import os
+import re
 import socket
 import sys
-from typing import Any, Dict, List, Optional
+import threading
+import time
+from collections import OrderedDict, deque
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from contextlib import redirect_stderr, redirect_stdout
+from functools import cached_property
+from typing import Any, Dict, List, Optional, Tuple
 
 import click
-import requests
-from tabulate import tabulate
+
+# Tunge og valgfrie moduler (requests, tabulate, dnspython, requests-cache,
+# diskcache) importeres først når de trengs, slik at f.eks. «norid --help»
+# og «norid das» starter raskt.
+
+
+def _module_available(name: str) -> bool:
+    """Sjekk om en modul er installert uten å importere den"""
+    return importlib.util.find_spec(name) is not None
+
 
 # DNS-oppslag
+DNS_AVAILABLE = _module_available("dns")
+
+# Rask JSON-parsing og -serialisering (valgfritt)
 try:
-    import dns.resolver as dns_resolver
-    DNS_AVAILABLE = True
+    import orjson
+    ORJSON_AVAILABLE = True
 except ImportError:
-    dns_resolver = None
-    DNS_AVAILABLE = False
+    orjson = None
+    ORJSON_AVAILABLE = False
+
+# Mellomlagring av RDAP-svar på disk (valgfritt)
+REQUESTS_CACHE_AVAILABLE = _module_available("requests_cache")
+
+# Mellomlagring av whois/DAS-svar på disk (valgfritt)
+DISKCACHE_AVAILABLE = _module_available("diskcache")
 
 # API-konfigurasjon
 RDAP_BASE_URL = "https://rdap.norid.no"
@@ -38,29 +65,132 @@ WHOIS_PORT = 43
 DAS_HOST = "finger.norid.no"
 DAS_TEST_HOST = "finger.test.norid.no"
 DAS_PORT = 79
+SOCKET_RECV_SIZE = 65536
+MAX_RESPONSE_SIZE = 1024 * 1024  # Whois/DAS-svar er i praksis under 8 KiB
+
+# Cache-konfigurasjon
+CACHE_DIR = os.path.expanduser("~/.cache/norid")
+DEFAULT_CACHE_TTL = 3600
+SOCKET_CACHE_TTL = {DAS_PORT: 300, WHOIS_PORT: 3600}
+SOCKET_CACHE_SIZE = 2048
+
+# Antall samtidige whois/DAS-oppslag i klientens trådpool
+SOCKET_POOL_SIZE = 16
+
+# Hvor lenge oppslåtte IP-adresser for whois/DAS gjenbrukes (sekunder)
+HOST_CACHE_TTL = 300
+
+# Unix-socket for «norid serve»
+SERVE_SOCKET = os.path.join(CACHE_DIR, "norid.sock")
+SERVE_REQUEST_TIMEOUT = 5  # Sekunder en klient får på å sende forespørselen og lese svaret
+
+# Rate-limit for RDAP: maks 10 oppslag per minutt
+RDAP_RATE_LIMIT = 10
+RDAP_RATE_WINDOW = 60
+
+# Hvor lenge et bekreftet registrert domene regnes som opptatt uten nytt oppslag
+TAKEN_TTL = 24 * 3600
+
+# Tilkoblingspool for RDAP-sesjonen
+HTTP_POOL_SIZE = 32
+
+
+class RateLimiter:
+    """Trådsikker begrensning av antall kall innenfor et glidende tidsvindu"""
+
+    def __init__(self, max_calls: int, period: float):
+        self.max_calls = max_calls
+        self.period = period
+        self._calls = deque()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """Vent til et nytt kall er tillatt"""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                while self._calls and now - self._calls[0] >= self.period:
+                    self._calls.popleft()
+                if len(self._calls) < self.max_calls:
+                    self._calls.append(now)
+                    return
+                wait = self.period - (now - self._calls[0])
+            time.sleep(wait)
 
 
 class NoridClient:
     """Klient for Norid sine offentlige tjenester"""
 
-    def __init__(self, use_test: bool = False):
+    def __init__(self, use_test: bool = False, use_cache: bool = True,
+                 cache_ttl: Optional[int] = None):
         self.use_test = use_test
+        self.use_cache = use_cache
+        self.cache_ttl = cache_ttl
         self.rdap_url = RDAP_TEST_URL if use_test else RDAP_BASE_URL
         self.whois_host = WHOIS_TEST_HOST if use_test else WHOIS_HOST
         self.das_host = DAS_TEST_HOST if use_test else DAS_HOST
-        self.session = requests.Session()
-        self.session.headers.update({
+        self._socket_cache = OrderedDict()
+        self._socket_cache_lock = threading.Lock()
+        self._disk_cache = None
+        self._taken_file = os.path.join(CACHE_DIR, "taken-test.txt" if use_test else "taken.txt")
+        self._taken_lock = threading.Lock()
+        self._host_cache = {}
+
+    @cached_property
+    def session(self):
+        """HTTP-sesjon for RDAP, med diskcache hvis tilgjengelig (opprettes ved første bruk)"""
+        import requests
+        from requests.adapters import HTTPAdapter
+        from urllib3.util import make_headers
+        from urllib3.util.retry import Retry
+
+        if self.use_cache and REQUESTS_CACHE_AVAILABLE:
+            import requests_cache
+
+            os.makedirs(CACHE_DIR, exist_ok=True)
+            # 404 mellomlagres også, slik at gjentatte oppslag på ledige domener
+            # ikke teller mot rate-limit
+            session = requests_cache.CachedSession(
+                cache_name=os.path.join(CACHE_DIR, "rdap"),
+                backend="sqlite",
+                expire_after=DEFAULT_CACHE_TTL if self.cache_ttl is None else self.cache_ttl,
+                allowable_methods=("GET", "HEAD"),
+                allowable_codes=(200, 404),
+            )
+        else:
+            session = requests.Session()
+
+        session.mount("https://", HTTPAdapter(
+            pool_connections=HTTP_POOL_SIZE,
+            pool_maxsize=HTTP_POOL_SIZE,
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.3,
+                status_forcelist=(500, 502, 503, 504),
+                allowed_methods=("GET", "HEAD"),
+                raise_on_status=False,
+            ),
+        ))
+        # Be om komprimerte svar; br/zstd tas med hvis brotli/zstandard er installert
+        accept_encoding = make_headers(accept_encoding=True)["accept-encoding"]
+        session.headers.update({
             "Accept": "application/rdap+json, application/json",
+            "Accept-Encoding": accept_encoding.replace(",", ", "),
             "User-Agent": "Norid-CLI/1.0.0"
         })
+        return session
 
     def _rdap_request(self, endpoint: str, method: str = "GET") -> Optional[Dict]:
         """Utfør HTTP-forespørsel mot RDAP API"""
+        import requests
+
         url = f"{self.rdap_url}/{endpoint}"
         try:
             response = self.session.request(method=method, url=url, timeout=30)
             
             if response.status_code == 200:
+                if ORJSON_AVAILABLE:
+                    return orjson.loads(response.content)
                 return response.json()
             elif response.status_code == 404:
                 return None
@@ -78,29 +208,117 @@ class NoridClient:
         except requests.exceptions.Timeout:
             raise click.ClickException("Forespørselen tok for lang tid (timeout)")
 
+    def _rdap_cached(self, endpoint: str) -> bool:
+        """Sjekk om requests_cache har et gyldig svar for endepunktet (krever ingen nettverkskall)"""
+        import requests
+
+        cache = getattr(self.session, "cache", None)
+        if cache is None:
+            return False
+        request = self.session.prepare_request(requests.Request("GET", f"{self.rdap_url}/{endpoint}"))
+        response = cache.get_response(cache.create_key(request))
+        return response is not None and not response.is_expired
+
     def _rdap_head(self, endpoint: str) -> bool:
         """Sjekk om et objekt eksisterer via HEAD-request"""
+        import requests
+
         url = f"{self.rdap_url}/{endpoint}"
         try:
-            response = self.session.head(url, timeout=30)
-            return response.status_code == 200
+            # Bare statuskoden brukes: ingen viderekobling og ingen body
+            with self.session.head(url, timeout=30, allow_redirects=False, stream=True,
+                                   headers={"Accept": "*/*"}) as response:
+                return response.status_code == 200
         except requests.exceptions.RequestException:
             return False
 
     def _socket_request(self, host: str, port: int, query: str) -> str:
-        """Utfør socket-forespørsel (for whois og DAS)"""
+        """Utfør socket-forespørsel (for whois og DAS), via cache hvis aktivert"""
+        if not self.use_cache:
+            return self._socket_query(host, port, query)
+
+        key = (host, port, query)
+        response = self._socket_cache_get(key)
+        if response is None:
+            response = self._socket_query(host, port, query)
+            self._socket_cache_set(key, response)
+        return response
+
+    def _socket_cache_get(self, key: Tuple[str, int, str]) -> Optional[str]:
+        """Hent whois/DAS-svar fra minnet, deretter fra disk"""
+        with self._socket_cache_lock:
+            entry = self._socket_cache.get(key)
+            if entry is not None:
+                expires, response = entry
+                if time.monotonic() < expires:
+                    self._socket_cache.move_to_end(key)
+                    return response
+                del self._socket_cache[key]
+
+        disk_cache = self._get_disk_cache()
+        if disk_cache is not None:
+            return disk_cache.get(key)
+        return None
+
+    def _socket_cache_set(self, key: Tuple[str, int, str], response: str) -> None:
+        """Lagre whois/DAS-svar i minnet (LRU) og på disk"""
+        ttl = self.cache_ttl if self.cache_ttl is not None else SOCKET_CACHE_TTL[key[1]]
+        with self._socket_cache_lock:
+            self._socket_cache[key] = (time.monotonic() + ttl, response)
+            self._socket_cache.move_to_end(key)
+            if len(self._socket_cache) > SOCKET_CACHE_SIZE:
+                self._socket_cache.popitem(last=False)
+
+        disk_cache = self._get_disk_cache()
+        if disk_cache is not None:
+            disk_cache.set(key, response, expire=ttl)
+
+    def _get_disk_cache(self):
+        """Åpne diskcache for socket-svar ved første bruk"""
+        if self._disk_cache is None and DISKCACHE_AVAILABLE:
+            import diskcache
+
+            with self._socket_cache_lock:
+                if self._disk_cache is None:
+                    self._disk_cache = diskcache.Cache(os.path.join(CACHE_DIR, "socket"))
+        return self._disk_cache
+
+    def _resolve(self, host: str, port: int) -> Tuple[str, int]:
+        """Slå opp adressen til host (mellomlagres i HOST_CACHE_TTL sekunder)"""
+        cached = self._host_cache.get((host, port))
+        if cached and cached[0] > time.monotonic():
+            return cached[1]
+        
+        addrinfo = socket.getaddrinfo(host, port, socket.AF_INET, socket.SOCK_STREAM)
+        address = addrinfo[0][4]
+        self._host_cache[(host, port)] = (time.monotonic() + HOST_CACHE_TTL, address)
+        return address
+
+    def _socket_query(self, host: str, port: int, query: str) -> str:
+        """Utfør socket-forespørsel mot whois/DAS-serveren"""
         try:
             with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
                 sock.settimeout(30)
-                sock.connect((host, port))
+                # Spørringen er én liten skriving; ikke vent på Nagle
+                sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+                try:
+                    sock.connect(self._resolve(host, port))
+                except OSError:
+                    # Adressen kan ha endret seg; slå opp på nytt neste gang
+                    self._host_cache.pop((host, port), None)
+                    raise
                 sock.sendall(f"{query}\r\n".encode("utf-8"))
                 
-                response = b""
+                # Les rett inn i én buffer, uten et nytt bytes-objekt per bit
+                response = bytearray()
+                buffer = memoryview(bytearray(SOCKET_RECV_SIZE))
                 while True:
-                    data = sock.recv(4096)
-                    if not data:
+                    size = sock.recv_into(buffer)
+                    if not size:
                         break
-                    response += data
+                    response += buffer[:size]
+                    if len(response) > MAX_RESPONSE_SIZE:
+                        raise click.ClickException("Svaret fra serveren er for stort")
                 
                 return response.decode("utf-8", errors="replace")
         except socket.timeout:
@@ -108,10 +326,64 @@ class NoridClient:
         except socket.error as e:
             raise click.ClickException(f"Nettverksfeil: {e}")
 
+    # Lokal liste over domener som er kjent registrert
+    @cached_property
+    def _known_taken(self) -> Dict[str, float]:
+        """Domener som tidligere er bekreftet registrert, med tidspunkt (lest fra disk)
+
+        Hver linje er «domene<TAB>unix-tid». Linjer uten tidspunkt (eldre
+        format) regnes som utløpt.
+        """
+        taken = {}
+        try:
+            with open(self._taken_file, encoding="utf-8") as f:
+                for line in f:
+                    domain, _, stamp = line.strip().partition("\t")
+                    if not domain:
+                        continue
+                    try:
+                        confirmed = float(stamp)
+                    except ValueError:
+                        confirmed = 0.0
+                    taken[domain] = max(confirmed, taken.get(domain, 0.0))
+        except OSError:
+            pass
+        return taken
+
+    def is_known_taken(self, domain: str) -> bool:
+        """Sjekk om domenet er bekreftet registrert de siste TAKEN_TTL sekundene
+
+        Brukes kun til å korte av «opptatt»-svar; ledige domener
+        sjekkes alltid mot nettverket. Et domene kan slettes og bli
+        ledig igjen, så bekreftelsen gjelder bare en begrenset tid.
+        """
+        if not self.use_cache:
+            return False
+        confirmed = self._known_taken.get(domain.lower())
+        return confirmed is not None and time.time() - confirmed < TAKEN_TTL
+
+    def remember_taken(self, domain: str) -> None:
+        """Husk at domenet er registrert akkurat nå (lagres på disk)"""
+        domain = domain.lower()
+        with self._taken_lock:
+            if self.is_known_taken(domain):
+                return
+            now = time.time()
+            self._known_taken[domain] = now
+            try:
+                os.makedirs(CACHE_DIR, exist_ok=True)
+                with open(self._taken_file, "a", encoding="utf-8") as f:
+                    f.write(f"{domain}\t{now:.0f}\n")
+            except OSError:
+                pass
+
     # RDAP-metoder
     def rdap_domain(self, domain: str) -> Optional[Dict]:
         """Hent domenedata via RDAP"""
-        return self._rdap_request(f"domain/{domain}")
+        data = self._rdap_request(f"domain/{domain}")
+        if data:
+            self.remember_taken(domain)
+        return data
 
     def rdap_entity(self, handle: str) -> Optional[Dict]:
         """Hent entitet (kontakt/registrar) via RDAP"""
@@ -125,9 +397,36 @@ class NoridClient:
         """Søk etter navneservere"""
         return self._rdap_request(f"nameservers?name={pattern}")
 
-    def rdap_domain_exists(self, domain: str) -> bool:
+    def rdap_domain_exists(self, domain: str, fresh: bool = False) -> bool:
         """Sjekk om domene eksisterer (HEAD-request)"""
-        return self._rdap_head(f"domain/{domain}")
+        if not fresh and self.is_known_taken(domain):
+            return True
+        exists = self._rdap_head(f"domain/{domain}")
+        if exists:
+            self.remember_taken(domain)
+        return exists
+
+    def rdap_domains(self, domains: List[str], concurrency: int = 4
+                     ) -> List[Tuple[str, Optional[Dict], Optional[str]]]:
+        """Hent domenedata for flere domener parallelt
+
+        Returnerer (domene, data, feilmelding) i samme rekkefølge som input.
+        Oppslagene begrenses til Norid sin rate-limit på 10 per minutt.
+        """
+        limiter = RateLimiter(RDAP_RATE_LIMIT, RDAP_RATE_WINDOW)
+        self.session  # Opprett sesjonen før trådene deler den
+
+        def lookup(domain: str) -> Tuple[str, Optional[Dict], Optional[str]]:
+            # Svar fra cachen går ikke mot Norid og skal ikke vente på rate-limit
+            if not self._rdap_cached(f"domain/{domain}"):
+                limiter.acquire()
+            try:
+                return domain, self.rdap_domain(domain), None
+            except click.ClickException as e:
+                return domain, None, e.format_message()
+
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            return list(executor.map(lookup, domains))
 
     # Whois-metode
     def whois(self, domain: str) -> str:
@@ -137,73 +436,231 @@ class NoridClient:
     # DAS-metode
     def das(self, domain: str) -> str:
         """Domain Availability Service (DAS) oppslag"""
-        return self._socket_request(self.das_host, DAS_PORT, domain)
+        response = self._socket_request(self.das_host, DAS_PORT, domain)
+        if classify_das(response) == "taken":
+            self.remember_taken(domain)
+        return response
+
+    @cached_property
+    def _pool(self) -> ThreadPoolExecutor:
+        """Trådpool for DAS-oppslag i bakgrunnen (opprettes ved første bruk)"""
+        return ThreadPoolExecutor(max_workers=SOCKET_POOL_SIZE, thread_name_prefix="norid")
+
+    def das_async(self, domain: str) -> Future:
+        """Start DAS-oppslag i bakgrunnen"""
+        return self._pool.submit(self.das, domain)
+
+    def das_many(self, domains: List[str]) -> Dict[str, str]:
+        """DAS-oppslag for flere domener over én TCP-forbindelse
+
+        Alle spørringene sendes samlet (pipelining). Domener som ikke får et
+        svar som navngir dem (f.eks. fordi serveren lukker etter ett svar),
+        slås opp enkeltvis i klientens trådpool.
+        """
+        results = {}
+        pending = []
+        for domain in dict.fromkeys(domains):
+            cached = None
+            if self.use_cache:
+                cached = self._socket_cache_get((self.das_host, DAS_PORT, domain))
+            if cached is None:
+                pending.append(domain)
+            else:
+                results[domain] = cached
+
+        replies = {}
+        if len(pending) > 1:
+            raw = self._socket_query(self.das_host, DAS_PORT, "\r\n".join(pending))
+            # Et svar brukes bare hvis det selv navngir domenet
+            for response in split_das_responses(raw):
+                replies.setdefault(das_response_domain(response), response)
+
+        unanswered = []
+        for domain in pending:
+            response = replies.get(domain.lower())
+            if response is None:
+                unanswered.append(domain)
+                continue
+            results[domain] = response
+            if self.use_cache:
+                self._socket_cache_set((self.das_host, DAS_PORT, domain), response)
+            if classify_das(response) == "taken":
+                self.remember_taken(domain)
+
+        futures = {domain: self.das_async(domain) for domain in unanswered}
+        for domain, future in futures.items():
+            results[domain] = future.result()
+
+        return {domain: results[domain] for domain in domains}
 
     # DNS-metoder
     def dns_lookup(self, domain: str) -> Dict[str, List[str]]:
-        """Hent DNS-records for et domene"""
-        records = {}
+        """Hent DNS-records for et domene (alle record-typer slås opp samtidig)"""
         record_types = ['A', 'AAAA', 'MX', 'NS', 'TXT', 'CNAME']
         
-        if DNS_AVAILABLE and dns_resolver:
+        if DNS_AVAILABLE:
             # Primær: bruk dnspython
-            for rtype in record_types:
+            import dns.resolver as dns_resolver
+
+            def lookup(rtype: str) -> Optional[List[str]]:
                 try:
                     answers = dns_resolver.resolve(domain, rtype)
-                    records[rtype] = [str(r) for r in answers]
+                    return [str(r) for r in answers]
                 except dns_resolver.NoAnswer:
-                    pass
+                    return None
                 except dns_resolver.NXDOMAIN:
                     raise click.ClickException(f"Domenet {domain} finnes ikke")
                 except dns_resolver.NoNameservers:
                     raise click.ClickException(f"Ingen navneservere svarer for {domain}")
                 except Exception:
-                    pass
+                    return None
         else:
             # Fallback: bruk Google DNS-over-HTTPS
-            records = self._dns_lookup_google(domain, record_types)
+            def lookup(rtype: str) -> Optional[List[str]]:
+                return self._dns_lookup_google(domain, rtype)
         
-        return records
+        return _lookup_record_types(record_types, lookup)
+
+    @cached_property
+    def _doh_session(self):
+        """HTTP-sesjon for DNS-over-HTTPS (gjenbruker TLS-forbindelsen)"""
+        import requests
+
+        session = requests.Session()
+        session.headers.update({
+            "Accept": "application/dns-json",
+            "User-Agent": "Norid-CLI/1.0.0"
+        })
+        return session
 
-    def _dns_lookup_google(self, domain: str, record_types: List[str]) -> Dict[str, List[str]]:
+    def _dns_lookup_google(self, domain: str, rtype: str) -> Optional[List[str]]:
         """Fallback DNS-oppslag via Google DNS-over-HTTPS"""
-        records = {}
-        
-        for rtype in record_types:
-            try:
-                url = f"https://dns.google/resolve?name={domain}&type={rtype}"
-                response = requests.get(url, timeout=10)
-                if response.status_code == 200:
-                    data = response.json()
-                    if data.get("Answer"):
-                        records[rtype] = [a["data"] for a in data["Answer"]]
-            except Exception:
-                pass
-        
-        return records
+        try:
+            url = f"https://dns.google/resolve?name={domain}&type={rtype}"
+            response = self._doh_session.get(url, timeout=10)
+            if response.status_code == 200:
+                data = response.json()
+                if data.get("Answer"):
+                    return [a["data"] for a in data["Answer"]]
+        except Exception:
+            pass
+        return None
+
+
+def _lookup_record_types(record_types: List[str], lookup) -> Dict[str, List[str]]:
+    """Kjør lookup(rtype) for alle record-typer samtidig
+
+    Resultatet beholder rekkefølgen i record_types. Feiler ett oppslag,
+    avbrytes resten og feilen sendes videre.
+    """
+    executor = ThreadPoolExecutor(max_workers=len(record_types))
+    futures = {executor.submit(lookup, rtype): rtype for rtype in record_types}
+    results = {}
+    try:
+        for future in as_completed(futures):
+            results[futures[future]] = future.result()
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+    
+    return {rtype: results[rtype] for rtype in record_types if results.get(rtype)}
 
 
 # Hjelpefunksjoner for output
 def format_json(data: Any) -> str:
     """Formater data som JSON"""
+    if ORJSON_AVAILABLE:
+        try:
+            return orjson.dumps(data, option=orjson.OPT_INDENT_2).decode("utf-8")
+        except TypeError:
+            # F.eks. heltall større enn 64 bit – la stdlib ta seg av det
+            pass
     return json.dumps(data, indent=2, ensure_ascii=False)
 
 
 def print_table(data: List[Dict], headers: List[str], keys: List[str]) -> None:
     """Skriv ut data som tabell"""
+    from tabulate import tabulate
+
     rows = [[row.get(k, "") for k in keys] for row in data]
     click.echo(tabulate(rows, headers=headers, tablefmt="simple"))
 
 
+# Minste luft rundt overskriftene i tabeller (som tabulate sin MIN_PADDING)
+TABLE_MIN_PADDING = 2
+
+
+def _simple_table(rows: List[List[str]], headers: List[str]) -> str:
+    """Lag en venstrejustert tabell i samme format som tabulate «simple»
+
+    Raskere enn tabulate for store søkeresultater med bare tekstceller.
+    Som tabulate er hver kolonne minst to tegn bredere enn overskriften;
+    tall høyrejusteres ikke, så cellene må være tekst.
+    """
+    widths = [len(h) + TABLE_MIN_PADDING for h in headers]
+    for row in rows:
+        for i, cell in enumerate(row):
+            if len(cell) > widths[i]:
+                widths[i] = len(cell)
+    
+    lines = [
+        "  ".join(h.ljust(w) for h, w in zip(headers, widths)).rstrip(),
+        "  ".join("-" * w for w in widths),
+    ]
+    lines.extend("  ".join(c.ljust(w) for c, w in zip(row, widths)).rstrip() for row in rows)
+    return "\n".join(lines)
+
+
+def _vcard_address(item: List) -> Optional[Tuple[str, str]]:
+    """Hent sted og land fra et vCard «adr»-felt"""
+    # Adresse er en liste
+    adr = item[3]
+    if isinstance(adr, list) and len(adr) > 3:
+        city = adr[3]
+        country = adr[6] if len(adr) > 6 else ""
+        if city or country:
+            return "Sted", f"{city}, {country}"
+    return None
+
+
+# vCard-felt -> funksjon som gir (etikett, verdi)
+_VCARD_HANDLERS = {
+    "fn": lambda item: ("Navn", item[3]),
+    "org": lambda item: ("Organisasjon", item[3]),
+    "email": lambda item: ("E-post", item[3]),
+    "tel": lambda item: ("Telefon", item[3]),
+    "adr": _vcard_address,
+}
+
+# RDAP-hendelse -> etikett
+_DOMAIN_EVENT_LABELS = {
+    "registration": "Registrert",
+    "last changed": "Sist endret",
+    "expiration": "Utløper",
+}
+_ENTITY_EVENT_LABELS = {
+    "registration": "Registrert",
+    "last changed": "Sist endret",
+}
+_NAMESERVER_EVENT_LINES = {
+    "registration": "\n  Registrert: ",
+    "last changed": "  Sist endret: ",
+}
+
+# Ferdig stilede skillelinjer (bygges én gang, ikke per oppslag)
+HEADER_RULE = click.style("=" * 60, fg="blue")
+DNS_RULE = click.style("=" * 50, fg="blue")
+
+
+def _echo_header(title: str) -> None:
+    """Skriv overskrift mellom to skillelinjer, i ett echo-kall"""
+    click.echo(f"\n{HEADER_RULE}\n{click.style(f'  {title}', fg='green', bold=True)}\n{HEADER_RULE}")
+
+
 def format_domain_info(data: Dict) -> None:
     """Formater og vis domeneinfo"""
-    click.echo()
-    click.echo(click.style("=" * 60, fg="blue"))
-    
     # Domenenavn
     domain_name = data.get("ldhName", data.get("unicodeName", "Ukjent"))
-    click.echo(click.style(f"  Domene: {domain_name}", fg="green", bold=True))
-    click.echo(click.style("=" * 60, fg="blue"))
+    _echo_header(f"Domene: {domain_name}")
     
     # Status
     statuses = data.get("status", [])
@@ -213,15 +670,10 @@ def format_domain_info(data: Dict) -> None:
     # Hendelser (registrering, sist endret, utløper)
     events = data.get("events", [])
     for event in events:
-        action = event.get("eventAction", "")
-        date = event.get("eventDate", "")[:10] if event.get("eventDate") else ""
-        
-        if action == "registration":
-            click.echo(f"  Registrert: {date}")
-        elif action == "last changed":
-            click.echo(f"  Sist endret: {date}")
-        elif action == "expiration":
-            click.echo(f"  Utløper: {date}")
+        label = _DOMAIN_EVENT_LABELS.get(event.get("eventAction", ""))
+        if label:
+            date = event.get("eventDate", "")[:10] if event.get("eventDate") else ""
+            click.echo(f"  {label}: {date}")
     
     # Navneservere
     nameservers = data.get("nameservers", [])
@@ -259,12 +711,8 @@ def format_domain_info(data: Dict) -> None:
 
 def format_entity_info(data: Dict) -> None:
     """Formater og vis entitetsinfo"""
-    click.echo()
-    click.echo(click.style("=" * 60, fg="blue"))
-    
     handle = data.get("handle", "Ukjent")
-    click.echo(click.style(f"  Entitet: {handle}", fg="green", bold=True))
-    click.echo(click.style("=" * 60, fg="blue"))
+    _echo_header(f"Entitet: {handle}")
     
     # Roller
     roles = data.get("roles", [])
@@ -280,44 +728,27 @@ def format_entity_info(data: Dict) -> None:
     vcard = data.get("vcardArray", [])
     if len(vcard) > 1:
         for item in vcard[1]:
-            if item[0] == "fn":
-                click.echo(f"  Navn: {item[3]}")
-            elif item[0] == "org":
-                click.echo(f"  Organisasjon: {item[3]}")
-            elif item[0] == "email":
-                click.echo(f"  E-post: {item[3]}")
-            elif item[0] == "tel":
-                click.echo(f"  Telefon: {item[3]}")
-            elif item[0] == "adr":
-                # Adresse er en liste
-                if isinstance(item[3], list) and len(item[3]) > 3:
-                    city = item[3][3] if len(item[3]) > 3 else ""
-                    country = item[3][6] if len(item[3]) > 6 else ""
-                    if city or country:
-                        click.echo(f"  Sted: {city}, {country}")
+            handler = _VCARD_HANDLERS.get(item[0])
+            if handler:
+                field = handler(item)
+                if field:
+                    click.echo(f"  {field[0]}: {field[1]}")
     
     # Hendelser
     events = data.get("events", [])
     for event in events:
-        action = event.get("eventAction", "")
-        date = event.get("eventDate", "")[:10] if event.get("eventDate") else ""
-        
-        if action == "registration":
-            click.echo(f"  Registrert: {date}")
-        elif action == "last changed":
-            click.echo(f"  Sist endret: {date}")
+        label = _ENTITY_EVENT_LABELS.get(event.get("eventAction", ""))
+        if label:
+            date = event.get("eventDate", "")[:10] if event.get("eventDate") else ""
+            click.echo(f"  {label}: {date}")
     
     click.echo()
 
 
 def format_nameserver_info(data: Dict) -> None:
     """Formater og vis navneserverinfo"""
-    click.echo()
-    click.echo(click.style("=" * 60, fg="blue"))
-    
     name = data.get("ldhName", "Ukjent")
-    click.echo(click.style(f"  Navneserver: {name}", fg="green", bold=True))
-    click.echo(click.style("=" * 60, fg="blue"))
+    _echo_header(f"Navneserver: {name}")
     
     handle = data.get("handle", "")
     if handle:
@@ -346,17 +777,24 @@ def format_nameserver_info(data: Dict) -> None:
     # Hendelser
     events = data.get("events", [])
     for event in events:
-        action = event.get("eventAction", "")
-        date = event.get("eventDate", "")[:10] if event.get("eventDate") else ""
-        
-        if action == "registration":
-            click.echo(f"\n  Registrert: {date}")
-        elif action == "last changed":
-            click.echo(f"  Sist endret: {date}")
+        line = _NAMESERVER_EVENT_LINES.get(event.get("eventAction", ""))
+        if line:
+            date = event.get("eventDate", "")[:10] if event.get("eventDate") else ""
+            click.echo(f"{line}{date}")
     
     click.echo()
 
 
+def _nameserver_search_row(ns: Dict) -> List[str]:
+    """Bygg én tabellrad for en navneserver i søkeresultatet"""
+    ips = ns.get("ipAddresses", {})
+    v4 = ", ".join(ips.get("v4", []))
+    v6 = ", ".join(ips.get("v6", []))
+    if len(v6) > 30:
+        v6 = v6[:30] + "..."
+    return [ns.get("handle", ""), ns.get("ldhName", ""), v4, v6]
+
+
 def format_nameserver_search_results(data: Dict) -> None:
     """Formater og vis søkeresultater for navneservere"""
     results = data.get("nameserverSearchResults", [])
@@ -368,34 +806,86 @@ def format_nameserver_search_results(data: Dict) -> None:
     click.echo(f"\nFant {len(results)} navneserver(e):\n")
     
     headers = ["Handle", "Navn", "IPv4", "IPv6"]
-    rows = []
+    rows = [_nameserver_search_row(ns) for ns in results]
     
-    for ns in results:
-        handle = ns.get("handle", "")
-        name = ns.get("ldhName", "")
-        ips = ns.get("ipAddresses", {})
-        v4 = ", ".join(ips.get("v4", []))
-        v6 = ", ".join(ips.get("v6", []))[:30] + "..." if len(", ".join(ips.get("v6", []))) > 30 else ", ".join(ips.get("v6", []))
-        rows.append([handle, name, v4, v6])
-    
-    click.echo(tabulate(rows, headers=headers, tablefmt="simple"))
+    click.echo(_simple_table(rows, headers))
     click.echo()
 
 
+# Nøkkelord i DAS-svar, gjenkjent i én passering over svaret
+_DAS_KEYWORDS_RE = re.compile(
+    r"not available|not registered|available|registered|delegated|invalid",
+    re.IGNORECASE,
+)
+
+_DAS_MESSAGES = {
+    "available": ("✓ {domain} er LEDIG", "green"),
+    "taken": ("✗ {domain} er OPPTATT", "red"),
+    "invalid": ("✗ {domain} er UGYLDIG", "yellow"),
+}
+
+
+def split_das_responses(raw: str) -> List[str]:
+    """Del opp sammenhengende DAS-svar
+
+    Hvert svar starter med en blokk kommentarlinjer («%») etterfulgt av
+    selve resultatet, så en ny kommentarlinje etter en resultatlinje
+    markerer starten på neste svar. Kommentarer etter siste resultat
+    hører til siste svar. Hvilket domene et svar gjelder, må sjekkes
+    med das_response_domain; rekkefølgen alene er ikke til å stole på.
+    """
+    responses = []
+    current = []
+    has_result = False
+
+    for line in raw.splitlines(keepends=True):
+        is_comment = line.startswith("%")
+        if is_comment and has_result:
+            responses.append("".join(current))
+            current = []
+            has_result = False
+        current.append(line)
+        if not is_comment and line.strip():
+            has_result = True
+
+    if has_result:
+        responses.append("".join(current))
+    elif responses and current:
+        responses[-1] += "".join(current)
+    return responses
+
+
+def das_response_domain(response: str) -> Optional[str]:
+    """Domenet et DAS-svar gjelder («example.no is available» -> "example.no"), eller None"""
+    for line in response.splitlines():
+        if line.strip() and not line.startswith("%"):
+            name = line.split(None, 1)[0].lower()
+            return name if "." in name else None
+    return None
+
+
+def classify_das(response: str) -> Optional[str]:
+    """Klassifiser DAS-svar som "available", "taken", "invalid" eller None (ukjent)"""
+    found = {match.lower() for match in _DAS_KEYWORDS_RE.findall(response)}
+
+    if ("available" in found and "not available" not in found) or "not registered" in found:
+        return "available"
+    if "registered" in found or "delegated" in found:
+        return "taken"
+    if "invalid" in found:
+        return "invalid"
+    return None
+
+
 def format_das_result(response: str, domain: str) -> None:
     """Formater og vis DAS-resultat"""
     click.echo()
     
-    response_lower = response.lower()
+    status = classify_das(response)
     
-    if "available" in response_lower and "not available" not in response_lower:
-        click.echo(click.style(f"✓ {domain} er LEDIG", fg="green", bold=True))
-    elif "not registered" in response_lower:
-        click.echo(click.style(f"✓ {domain} er LEDIG", fg="green", bold=True))
-    elif "registered" in response_lower or "delegated" in response_lower:
-        click.echo(click.style(f"✗ {domain} er OPPTATT", fg="red", bold=True))
-    elif "invalid" in response_lower:
-        click.echo(click.style(f"✗ {domain} er UGYLDIG", fg="yellow", bold=True))
+    if status in _DAS_MESSAGES:
+        message, color = _DAS_MESSAGES[status]
+        click.echo(click.style(message.format(domain=domain), fg=color, bold=True))
     else:
         click.echo(click.style(f"? {domain} - ukjent status", fg="yellow"))
         click.echo(f"\nRå respons:\n{response}")
@@ -406,9 +896,13 @@ def format_das_result(response: str, domain: str) -> None:
 # CLI-grupper og kommandoer
 @click.group()
 @click.option("--test", "-t", is_flag=True, help="Bruk testmiljø")
+@click.option("--no-cache", is_flag=True, help="Ikke bruk mellomlagrede svar")
+@click.option("--cache-ttl", type=int, default=None,
+              help="Levetid for mellomlagrede svar i sekunder "
+                   "[standard: 3600, 300 for DAS]")
 @click.version_option(version="1.0.0", prog_name="norid")
 @click.pass_context
-def cli(ctx, test: bool):
+def cli(ctx, test: bool, no_cache: bool, cache_ttl: int):
     """Norid CLI - Slå opp .no-domener uten autentisering.
     
     Tjenester som støttes:
@@ -419,8 +913,18 @@ def cli(ctx, test: bool):
       - Whois: Tradisjonelt domeneoppslag
     """
     ctx.ensure_object(dict)
-    ctx.obj["client"] = NoridClient(use_test=test)
+    if ctx.obj.get("serving") and ctx.invoked_subcommand == "serve":
+        raise click.ClickException("serve kan ikke kjøres via serve")
+    # I serve-modus deles klientene mellom kall, slik at TLS-forbindelser holdes varme
+    clients = ctx.obj.setdefault("clients", {})
+    key = (test, not no_cache, cache_ttl)
+    if key not in clients:
+        clients[key] = NoridClient(use_test=test, use_cache=not no_cache,
+                                   cache_ttl=cache_ttl)
+    ctx.obj["client"] = clients[key]
     ctx.obj["test"] = test
+    ctx.obj["use_cache"] = not no_cache
+    ctx.obj["cache_ttl"] = cache_ttl
 
 
 # === DOMAIN ===
@@ -428,8 +932,9 @@ def cli(ctx, test: bool):
 @click.argument("domain")
 @click.option("--available", "-a", is_flag=True, help="Kun sjekk om domene eksisterer (HEAD)")
 @click.option("--json", "as_json", is_flag=True, help="Output som JSON")
+@click.option("--fresh", is_flag=True, help="Ikke bruk lokal liste over kjent registrerte domener")
 @click.pass_context
-def domain(ctx, domain: str, available: bool, as_json: bool):
+def domain(ctx, domain: str, available: bool, as_json: bool, fresh: bool):
     """Slå opp domene via RDAP
     
     \b
@@ -441,7 +946,7 @@ def domain(ctx, domain: str, available: bool, as_json: bool):
     client = ctx.obj["client"]
     
     if available:
-        exists = client.rdap_domain_exists(domain)
+        exists = client.rdap_domain_exists(domain, fresh=fresh)
         if exists:
             click.echo(click.style(f"✗ {domain} er registrert", fg="red"))
         else:
@@ -543,6 +1048,68 @@ def search_nameservers(ctx, pattern: str, as_json: bool):
         format_nameserver_search_results(data)
 
 
+# === BULK ===
+@cli.group()
+def bulk():
+    """Masseoppslag"""
+    pass
+
+
+@bulk.command("domains")
+@click.argument("file", type=click.File("r", encoding="utf-8"))
+@click.option("--concurrency", "-c", type=click.IntRange(1, 10), default=4, show_default=True,
+              help="Antall samtidige oppslag")
+@click.option("--json", "as_json", is_flag=True, help="Output som JSON")
+@click.pass_context
+def bulk_domains(ctx, file, concurrency: int, as_json: bool):
+    """Slå opp mange domener via RDAP (ett domene per linje)
+
+    \b
+    Oppslagene kjøres parallelt, men begrenses til 10 per minutt
+    på grunn av Norid sin rate-limit.
+
+    \b
+    Eksempler:
+      norid bulk domains domener.txt
+      cat domener.txt | norid bulk domains - --json
+    """
+    client = ctx.obj["client"]
+    domains = [line.strip() for line in file if line.strip() and not line.startswith("#")]
+
+    if not domains:
+        click.echo(click.style("Ingen domener å slå opp", fg="yellow"))
+        return
+
+    results = client.rdap_domains(domains, concurrency=concurrency)
+
+    if as_json:
+        click.echo(format_json({
+            domain: data if error is None else {"error": error}
+            for domain, data, error in results
+        }))
+        return
+
+    from tabulate import tabulate
+
+    rows = []
+    for domain, data, error in results:
+        if error:
+            rows.append([domain, "Feil", error])
+        elif data is None:
+            rows.append([domain, "Ikke registrert", ""])
+        else:
+            registrar = next(
+                (e.get("handle", "") for e in data.get("entities", [])
+                 if "registrar" in e.get("roles", [])),
+                "",
+            )
+            rows.append([domain, "Registrert", registrar])
+
+    click.echo()
+    click.echo(tabulate(rows, headers=["Domene", "Status", "Registrar"], tablefmt="simple"))
+    click.echo()
+
+
 # === WHOIS ===
 @cli.command()
 @click.argument("domain")
@@ -566,24 +1133,46 @@ def whois(ctx, domain: str):
 
 # === DAS ===
 @cli.command()
-@click.argument("domain")
+@click.argument("domains", nargs=-1, required=True)
 @click.option("--raw", "-r", is_flag=True, help="Vis rå respons")
+@click.option("--fresh", is_flag=True, help="Ikke bruk lokal liste over kjent registrerte domener")
 @click.pass_context
-def das(ctx, domain: str, raw: bool):
+def das(ctx, domains: Tuple[str, ...], raw: bool, fresh: bool):
     """Sjekk om domene er ledig (DAS)
     
+    Flere domener sendes samlet over én forbindelse. Domener som
+    er bekreftet registrert det siste døgnet, rapporteres som opptatt
+    uten nytt oppslag (bruk --fresh for å sjekke på nytt). Ledige
+    domener sjekkes alltid.
+    
     \b
     Eksempler:
       norid das example.no
+      norid das example1.no example2.no example3.no
       norid das --test domain.no
     """
     client = ctx.obj["client"]
-    response = client.das(domain)
     
-    if raw:
-        click.echo(response)
-    else:
-        format_das_result(response, domain)
+    known_taken = set()
+    if not (raw or fresh):
+        known_taken = {d for d in domains if client.is_known_taken(d)}
+    lookup = [d for d in dict.fromkeys(domains) if d not in known_taken]
+    
+    responses = {}
+    if len(lookup) == 1:
+        responses[lookup[0]] = client.das(lookup[0])
+    elif lookup:
+        responses = client.das_many(lookup)
+    
+    for domain in dict.fromkeys(domains):
+        if domain in known_taken:
+            click.echo()
+            click.echo(click.style(f"✗ {domain} er OPPTATT (lokal cache)", fg="red", bold=True))
+            click.echo()
+        elif raw:
+            click.echo(responses[domain])
+        else:
+            format_das_result(responses[domain], domain)
 
 
 # === DNS ===
@@ -615,8 +1204,10 @@ def dns(ctx, domain: str, as_json: bool):
     else:
         click.echo()
         click.echo(click.style(f"DNS Records for {domain}", fg="green", bold=True))
-        click.echo(click.style("=" * 50, fg="blue"))
+        click.echo(DNS_RULE)
         
+        from tabulate import tabulate
+
         rows = []
         for rtype, values in records.items():
             for value in values:
@@ -626,5 +1217,94 @@ def dns(ctx, domain: str, as_json: bool):
         click.echo()
 
 
+# === SERVE ===
+def _read_serve_request(conn: socket.socket) -> Tuple[bool, List[str]]:
+    """Les en forespørsel: farge, antall argumenter og argumentene, NUL-separert"""
+    buf = bytearray()
+    while True:
+        fields = buf.split(b"\0")
+        if len(fields) > 2 and fields[1].isdigit() and len(fields) > int(fields[1]) + 2:
+            count = int(fields[1])
+            args = [f.decode("utf-8", errors="replace") for f in fields[2:2 + count]]
+            return fields[0] == b"1", args
+        data = conn.recv(65536)
+        if not data:
+            raise ValueError("Ufullstendig forespørsel")
+        buf.extend(data)
+
+
+def _run_serve_request(args: List[str], color: bool, clients: Dict) -> str:
+    """Kjør en CLI-kommando i denne prosessen og returner output"""
+    out = io.StringIO()
+    with redirect_stdout(out), redirect_stderr(out):
+        try:
+            cli.main(args, prog_name="norid", standalone_mode=False,
+                     obj={"clients": clients, "serving": True}, color=color)
+        except click.ClickException as e:
+            e.show()
+        except (click.exceptions.Abort, click.exceptions.Exit, SystemExit):
+            pass
+        except Exception as e:
+            # Et feilet oppslag skal ikke ta ned tjenesten
+            click.echo(f"Uventet feil: {e}", err=True)
+    return out.getvalue()
+
+
+@cli.command()
+@click.option("--socket", "socket_path", default=SERVE_SOCKET, show_default=True,
+              help="Sti til Unix-socket")
+@click.pass_context
+def serve(ctx, socket_path: str):
+    """Kjør som bakgrunnstjeneste på en Unix-socket
+
+    \b
+    Holder Python-prosessen og RDAP-sesjonen varm, slik at gjentatte
+    oppslag slipper oppstartstid og nye TLS-håndtrykk. Send kommandoer
+    med norid-client.sh.
+
+    \b
+    Eksempler:
+      norid serve &
+      ./norid-client.sh das example.no
+    """
+    if not hasattr(socket, "AF_UNIX"):
+        raise click.ClickException("Serve-modus krever Unix-socket (støttes ikke på Windows)")
+
+    if os.path.exists(socket_path):
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as probe:
+            if probe.connect_ex(socket_path) == 0:
+                raise click.ClickException(f"En tjeneste kjører allerede på {socket_path}")
+        os.unlink(socket_path)
+
+    os.makedirs(os.path.dirname(socket_path) or ".", exist_ok=True)
+    clients = ctx.obj["clients"]
+
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as server:
+        server.bind(socket_path)
+        os.chmod(socket_path, 0o600)
+        server.listen()
+        click.echo(click.style(f"Lytter på {socket_path} (Ctrl+C for å avslutte)", fg="blue"))
+
+        try:
+            while True:
+                conn, _ = server.accept()
+                with conn:
+                    # En klient som ikke sender noe skal ikke blokkere tjenesten
+                    conn.settimeout(SERVE_REQUEST_TIMEOUT)
+                    try:
+                        color, args = _read_serve_request(conn)
+                    except (ValueError, OSError):
+                        continue
+                    output = _run_serve_request(args, color, clients)
+                    try:
+                        conn.sendall(output.encode("utf-8"))
+                    except OSError:
+                        pass
+        except KeyboardInterrupt:
+            pass
+        finally:
+            os.unlink(socket_path)
+
+
 if __name__ == "__main__":
     cli()
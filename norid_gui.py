@@ -10,21 +10,55 @@ Tjenester:
 Ingen autentisering kreves.
 """
 
+import asyncio
+import importlib.util
 import json
+import os
+import re
 import socket
 import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from functools import cached_property
+from tkinter import filedialog
 from typing import Any, Dict, Optional
 
+# customtkinter må importeres her siden widget-klassene arver fra den;
+# requests og dnspython importeres først ved første oppslag.
 import customtkinter as ctk
-import requests
 
 # DNS-oppslag
+DNS_AVAILABLE = importlib.util.find_spec("dns") is not None
+
+# HTTP/2 for RDAP (httpx med h2), ellers requests
+HTTPX_AVAILABLE = (importlib.util.find_spec("httpx") is not None
+                   and importlib.util.find_spec("h2") is not None)
+
+# Brotli-komprimerte svar kan bare be om hvis en dekoder er installert
+BROTLI_AVAILABLE = (importlib.util.find_spec("brotli") is not None
+                    or importlib.util.find_spec("brotlicffi") is not None)
+ACCEPT_ENCODING = "br, gzip" if BROTLI_AVAILABLE else "gzip"
+
+# Raskere JSON-formatering (importeres her, så format_json slipper import per kall)
 try:
-    import dns.resolver as dns_resolver
-    DNS_AVAILABLE = True
+    import orjson
+    ORJSON_AVAILABLE = True
 except ImportError:
-    dns_resolver = None
-    DNS_AVAILABLE = False
+    orjson = None
+    ORJSON_AVAILABLE = False
+
+# Mellomlagring av oppslag på disk, så en omstart ikke starter kaldt (valgfritt)
+DISKCACHE_AVAILABLE = importlib.util.find_spec("diskcache") is not None
+
+# Store tekster settes inn i tekstboksene i biter av denne størrelsen
+TEXT_CHUNK_SIZE = 16384
+
+# Lengre svar kuttes i visningen; hele svaret kan lagres med Ctrl+S (⌘S)
+MAX_DISPLAY_SIZE = 200_000
+
+# Gjentatte klikk/Enter innen så mange millisekunder gir bare ett oppslag
+DEBOUNCE_MS = 300
 
 # ============================================================================
 # FARGEPALETT - Developer Tool / IDE Theme
@@ -44,6 +78,59 @@ COLORS = {
     "accent": "#60A5FA",         # Aksent lyseblå
 }
 
+# Fargene ResultCard bruker ved hvert klikk, som konstanter
+C_PRIMARY = COLORS["primary"]
+C_SUCCESS = COLORS["success"]
+C_ERROR = COLORS["error"]
+C_WARNING = COLORS["warning"]
+C_TEXT = COLORS["text"]
+C_TEXT_MUTED = COLORS["text_muted"]
+C_BORDER = COLORS["border"]
+
+# Fonter deles mellom widgets i stedet for å opprettes per widget
+MONO_FAMILY = "SF Mono, Menlo, Monaco, Consolas, monospace"
+_fonts: dict[tuple, ctk.CTkFont] = {}
+
+
+def get_font(size: int, weight: str = "normal", family: Optional[str] = None) -> ctk.CTkFont:
+    """Hent delt CTkFont (opprettes ved første bruk, etter at vinduet finnes)"""
+    key = (size, weight, family)
+    font = _fonts.get(key)
+    if font is None:
+        font = _fonts[key] = ctk.CTkFont(family=family, size=size, weight=weight)
+    return font
+
+
+# Skillelinjer og tabellhoder i de formaterte visningene, bygget én gang
+RULE = "─" * 56
+SUBRULE = f"  {'─' * 40}"
+NS_SEARCH_HEADER = f"  {'HANDLE':<16} {'NAVN':<28} IPv4"
+NS_SEARCH_RULE = f"  {'─' * 16} {'─' * 28} {'─' * 10}"
+NS_SEARCH_ROW = "  {:<16.15} {:<28.27} {:.20}\n".format  # Presisjonen kutter feltene
+DNS_RULE = "=" * 50
+DNS_SUBRULE = "-" * 50
+DNS_HEADER = f"{'Type':<8} Record"
+
+# RDAP-hendelse -> etikett i domene- og entitetsvisningen
+_DOMAIN_EVENT_LABELS = {
+    "registration": "  Registrert  │ ",
+    "last changed": "  Sist endret │ ",
+    "expiration": "  Utløper     │ ",
+}
+_ENTITY_EVENT_LABELS = {
+    "registration": "  Registrert  │ ",
+    "last changed": "  Sist endret │ ",
+}
+
+# vCard-felt -> etikett i kontaktinfo («adr» håndteres for seg)
+_VCARD_LABELS = {
+    "fn": "    Navn:     ",
+    "org": "    Org:      ",
+    "email": "    E-post:   ",
+    "tel": "    Telefon:  ",
+}
+
+
 # Tema og utseende
 ctk.set_appearance_mode("dark")
 ctk.set_default_color_theme("blue")
@@ -57,64 +144,342 @@ WHOIS_PORT = 43
 DAS_HOST = "finger.norid.no"
 DAS_TEST_HOST = "finger.test.norid.no"
 DAS_PORT = 79
+SOCKET_RECV_SIZE = 65536
+MAX_RESPONSE_SIZE = 1024 * 1024  # Whois/DAS-svar er i praksis under 8 KiB
+
+# Antall samtidige oppslag i klientens trådpool
+CLIENT_POOL_SIZE = 16
+
+# Mellomlagring av oppslag i minnet (sekunder)
+RDAP_CACHE_TTL = 300
+SOCKET_CACHE_TTL = {WHOIS_PORT: 300, DAS_PORT: 60}
+DNS_CACHE_TTL = 300  # Brukes når record-TTL ikke er kjent
+DNS_RECORD_TYPES = ('A', 'AAAA', 'MX', 'NS', 'TXT', 'CNAME')
+CACHE_SIZE = 512
+CACHE_DIR = os.path.expanduser("~/.cache/norid")
+
+# Ledige whois/DAS-forbindelser lukkes etter så mange sekunder
+SOCKET_IDLE_TIMEOUT = 60
+
+# Porter som får en ferdig oppkoblet reserveforbindelse. Bare DAS: whois er
+# strengere rate-begrenset, og en ubrukt forbindelse der er bortkastet kvote.
+SPARE_SOCKET_PORTS = (DAS_PORT,)
+
+# Hvor lenge oppslåtte IP-adresser for whois/DAS gjenbrukes (sekunder)
+ADDRESS_CACHE_TTL = 900
+_address_cache: dict[str, tuple[float, str]] = {}
+
+# Én lesebuffer per arbeidstråd, gjenbrukt mellom oppslag
+_recv_buffers = threading.local()
+
+
+class ResponseTooLarge(Exception):
+    """Whois/DAS-serveren sendte mer enn MAX_RESPONSE_SIZE"""
 
 
 class NoridClient:
     """Klient for Norid sine offentlige tjenester"""
 
-    def __init__(self, use_test: bool = False):
+    def __init__(self, use_test: bool = False, use_cache: bool = True):
         self.use_test = use_test
+        self.use_cache = use_cache
         self.rdap_url = RDAP_TEST_URL if use_test else RDAP_BASE_URL
         self.whois_host = WHOIS_TEST_HOST if use_test else WHOIS_HOST
         self.das_host = DAS_TEST_HOST if use_test else DAS_HOST
-        self.session = requests.Session()
-        self.session.headers.update({
+        self._pool = ThreadPoolExecutor(max_workers=CLIENT_POOL_SIZE, thread_name_prefix="norid")
+        self._cache = OrderedDict()
+        self._cache_lock = threading.Lock()
+        self._disk_cache = None
+        self._sock_pool: dict[tuple[str, int], tuple[float, socket.socket]] = {}
+        self._sock_lock = threading.Lock()
+
+        # Koble til i bakgrunnen, så første oppslag slipper DNS-oppslag og håndtrykk
+        self._pool.submit(self._park_socket, self.das_host, DAS_PORT)
+        self._pool.submit(_resolve, self.whois_host)
+        self._pool.submit(self._prime_session)
+
+    def _prime_session(self):
+        """Åpne RDAP-forbindelsen på forhånd (beste forsøk)"""
+        try:
+            self.session.head(f"{self.rdap_url}/", timeout=5)
+        except Exception:
+            pass
+
+    def submit(self, func, *args) -> Future:
+        """Kjør funksjon i klientens trådpool"""
+        return self._pool.submit(func, *args)
+
+    def close(self, cancel_pending: bool = False):
+        """Avslutt trådpoolen uten å blokkere; sesjonene lukkes når påbegynte oppslag er ferdige"""
+        self._pool.shutdown(wait=False, cancel_futures=cancel_pending)
+        threading.Thread(target=self._release, daemon=True).start()
+
+    def _release(self):
+        """Vent til trådpoolen er tom, og lukk så sesjoner, ledige forbindelser og diskcache"""
+        self._pool.shutdown(wait=True)
+        for name in ("session", "_doh_session"):
+            if name in self.__dict__:
+                self.__dict__[name].close()
+        with self._sock_lock:
+            idle = list(self._sock_pool.values())
+            self._sock_pool.clear()
+        for _, sock in idle:
+            sock.close()
+        if self._disk_cache is not None:
+            self._disk_cache.close()
+
+    def _cache_get(self, key: tuple) -> Optional[tuple[bool, Any]]:
+        """Hent et tidligere vellykket oppslag fra minnet, deretter fra disk (None hvis cache er slått av)"""
+        if not self.use_cache:
+            return None
+        with self._cache_lock:
+            entry = self._cache.get(key)
+            if entry is not None:
+                expires, result = entry
+                if time.monotonic() < expires:
+                    self._cache.move_to_end(key)
+                    return result
+                del self._cache[key]
+
+        disk_cache = self._get_disk_cache()
+        if disk_cache is None:
+            return None
+        result, expire_time = disk_cache.get(key, expire_time=True)
+        if result is not None:
+            # Legg treffet i minnet, så neste oppslag gir samme objekt
+            self._remember(key, result, expire_time - time.time())
+        return result
+
+    def _cache_set(self, key: tuple, result: tuple[bool, Any], ttl: float):
+        """Lagre et vellykket oppslag i minnet (LRU, maks CACHE_SIZE) og på disk"""
+        if not result[0]:
+            return
+        self._remember(key, result, ttl)
+
+        disk_cache = self._get_disk_cache()
+        if disk_cache is not None:
+            disk_cache.set(key, result, expire=ttl)
+
+    def _remember(self, key: tuple, result: tuple[bool, Any], ttl: float):
+        """Legg et oppslag i minnecachen"""
+        with self._cache_lock:
+            self._cache[key] = (time.monotonic() + ttl, result)
+            self._cache.move_to_end(key)
+            if len(self._cache) > CACHE_SIZE:
+                self._cache.popitem(last=False)
+
+    def _get_disk_cache(self):
+        """Åpne diskcache for oppslag ved første bruk"""
+        if self._disk_cache is None and DISKCACHE_AVAILABLE:
+            import diskcache
+
+            with self._cache_lock:
+                if self._disk_cache is None:
+                    self._disk_cache = diskcache.Cache(os.path.join(CACHE_DIR, "gui"))
+        return self._disk_cache
+
+    def _cached(self, key: tuple, ttl: float, func) -> tuple[bool, Any]:
+        """Returner mellomlagret resultat, eller kall func og lagre svaret"""
+        result = self._cache_get(key)
+        if result is None:
+            result = func()
+            self._cache_set(key, result, ttl)
+        return result
+
+    @cached_property
+    def session(self):
+        """HTTP-sesjon for RDAP, med HTTP/2 hvis httpx er installert (opprettes ved første bruk)"""
+        return _http_session({
             "Accept": "application/rdap+json, application/json",
             "User-Agent": "Norid-GUI/1.0.0"
         })
 
     def _rdap_request(self, endpoint: str) -> tuple[bool, Any]:
-        """Utfør HTTP-forespørsel mot RDAP API"""
+        """Utfør HTTP-forespørsel mot RDAP API, via cache"""
+        return self._cached(("rdap", self.rdap_url, endpoint), RDAP_CACHE_TTL,
+                            lambda: self._rdap_fetch(endpoint))
+
+    def _rdap_fetch(self, endpoint: str) -> tuple[bool, Any]:
+        """Hent fra RDAP API"""
+        if HTTPX_AVAILABLE:
+            import httpx
+
+            connect_error, timeout_error = httpx.ConnectError, httpx.TimeoutException
+        else:
+            import requests
+
+            connect_error, timeout_error = requests.exceptions.ConnectionError, requests.exceptions.Timeout
+
         url = f"{self.rdap_url}/{endpoint}"
         try:
             response = self.session.get(url, timeout=30)
             
             if response.status_code == 200:
-                return True, response.json()
+                return True, parse_json(response.content)
             elif response.status_code == 404:
                 return False, "Ikke funnet"
             elif response.status_code == 429:
                 return False, "Rate-limit overskredet. Vent litt før du prøver igjen."
             else:
                 return False, f"Feil ({response.status_code}): {response.text}"
-        except requests.exceptions.ConnectionError:
+        except connect_error:
             return False, f"Kunne ikke koble til {self.rdap_url}"
-        except requests.exceptions.Timeout:
+        except timeout_error:
             return False, "Forespørselen tok for lang tid (timeout)"
         except Exception as e:
             return False, f"Uventet feil: {str(e)}"
 
     def _socket_request(self, host: str, port: int, query: str) -> tuple[bool, str]:
-        """Utfør socket-forespørsel (for whois og DAS)"""
+        """Utfør socket-forespørsel (for whois og DAS), via cache"""
+        return self._cached(("socket", f"{host}:{port}", query), SOCKET_CACHE_TTL[port],
+                            lambda: self._socket_query(host, port, query))
+
+    def _socket_query(self, host: str, port: int, query: str) -> tuple[bool, str]:
+        """Utfør socket-forespørsel mot whois/DAS-serveren
+
+        Whois og DAS lukker forbindelsen etter hvert svar, så i stedet for å
+        gjenbruke den åpnes en ny DAS-forbindelse i bakgrunnen, klar til neste
+        oppslag.
+        """
         try:
-            with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
-                sock.settimeout(30)
-                sock.connect((host, port))
-                sock.sendall(f"{query}\r\n".encode("utf-8"))
-                
-                response = b""
-                while True:
-                    data = sock.recv(4096)
-                    if not data:
-                        break
-                    response += data
-                
-                return True, response.decode("utf-8", errors="replace")
+            sock = self._take_socket(host, port)
+            if sock is not None:
+                try:
+                    response = self._exchange(sock, query)
+                except OSError:
+                    # Reserveforbindelsen var død; prøv med en ny
+                    response = None
+                else:
+                    self._prepare_socket(host, port)
+                    return True, response
+            
+            response = self._exchange(self._connect(host, port), query)
+            self._prepare_socket(host, port)
+            return True, response
+        except ResponseTooLarge:
+            return False, "Svaret fra serveren er for stort"
         except socket.timeout:
             return False, "Forespørselen tok for lang tid (timeout)"
         except socket.error as e:
+            # Adressen kan ha endret seg; slå opp på nytt neste gang
+            _address_cache.pop(host, None)
+            return False, f"Nettverksfeil: {e}"
+
+    async def _socket_request_aio(self, host: str, port: int, query: str) -> tuple[bool, str]:
+        """Som _socket_request, men uten å blokkere event-loopen"""
+        key = ("socket", f"{host}:{port}", query)
+        result = self._cache_get(key)
+        if result is None:
+            result = await self._socket_query_aio(host, port, query)
+            self._cache_set(key, result, SOCKET_CACHE_TTL[port])
+        return result
+
+    async def _socket_query_aio(self, host: str, port: int, query: str) -> tuple[bool, str]:
+        """Som _socket_query, men med asyncio-strømmer"""
+        try:
+            sock = self._take_socket(host, port)
+            if sock is not None:
+                try:
+                    response = await self._exchange_aio(query, sock=sock)
+                except OSError:
+                    # Reserveforbindelsen var død; prøv med en ny
+                    response = None
+                else:
+                    self._prepare_socket(host, port)
+                    return True, response
+            
+            address = await asyncio.get_running_loop().run_in_executor(None, _resolve, host)
+            response = await self._exchange_aio(query, host=address, port=port)
+            self._prepare_socket(host, port)
+            return True, response
+        except ResponseTooLarge:
+            return False, "Svaret fra serveren er for stort"
+        except (asyncio.TimeoutError, socket.timeout):
+            return False, "Forespørselen tok for lang tid (timeout)"
+        except OSError as e:
+            # Adressen kan ha endret seg; slå opp på nytt neste gang
+            _address_cache.pop(host, None)
             return False, f"Nettverksfeil: {e}"
 
+    @staticmethod
+    async def _exchange_aio(query: str, **connect_args) -> str:
+        """Send spørring og les svaret til serveren lukker forbindelsen"""
+        reader, writer = await asyncio.wait_for(asyncio.open_connection(**connect_args), 30)
+        try:
+            writer.write(_encode_query(query))
+            # Én frist for hele svaret, i stedet for en ny timer per read()
+            return await asyncio.wait_for(_read_response(reader, writer), 30)
+        finally:
+            writer.close()
+
+    @staticmethod
+    def _connect(host: str, port: int) -> socket.socket:
+        """Åpne TCP-forbindelse mot whois/DAS-serveren"""
+        sock = socket.create_connection((_resolve(host), port), timeout=30)
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+        return sock
+
+    @staticmethod
+    def _exchange(sock: socket.socket, query: str) -> str:
+        """Send spørring og les svaret til serveren lukker forbindelsen"""
+        with sock:
+            sock.sendall(_encode_query(query))
+            
+            # Les rett inn i trådens buffer, uten et nytt bytes-objekt per bit
+            response = bytearray()
+            buffer = _recv_buffer()
+            while True:
+                size = sock.recv_into(buffer)
+                if not size:
+                    break
+                response += buffer[:size]
+                if len(response) > MAX_RESPONSE_SIZE:
+                    raise ResponseTooLarge()
+            
+            return response.decode("utf-8", errors="replace")
+
+    def _take_socket(self, host: str, port: int) -> Optional[socket.socket]:
+        """Hent en ledig, åpen forbindelse fra poolen"""
+        with self._sock_lock:
+            entry = self._sock_pool.pop((host, port), None)
+        if entry is None:
+            return None
+        
+        parked, sock = entry
+        if time.monotonic() - parked > SOCKET_IDLE_TIMEOUT or not _socket_alive(sock):
+            sock.close()
+            return None
+        return sock
+
+    def _prepare_socket(self, host: str, port: int):
+        """Åpne en reserveforbindelse i bakgrunnen (bare for SPARE_SOCKET_PORTS)"""
+        if port not in SPARE_SOCKET_PORTS:
+            return
+        try:
+            self._pool.submit(self._park_socket, host, port)
+        except RuntimeError:
+            # Klienten er lukket
+            pass
+
+    def _park_socket(self, host: str, port: int):
+        """Koble til og legg forbindelsen i poolen
+
+        Det ligger høyst én ledig forbindelse per server. En som har ligget
+        lenger enn SOCKET_IDLE_TIMEOUT lukkes når den hentes ut, erstattes
+        eller når klienten lukkes, så det trengs ingen egen tråd per forbindelse.
+        """
+        try:
+            sock = self._connect(host, port)
+        except OSError:
+            return
+        
+        with self._sock_lock:
+            old = self._sock_pool.get((host, port))
+            self._sock_pool[(host, port)] = (time.monotonic(), sock)
+        if old is not None:
+            old[1].close()
+
     def rdap_domain(self, domain: str) -> tuple[bool, Any]:
         return self._rdap_request(f"domain/{domain}")
 
@@ -127,86 +492,319 @@ class NoridClient:
     def rdap_nameserver_search(self, pattern: str) -> tuple[bool, Any]:
         return self._rdap_request(f"nameservers?name={pattern}")
 
-    def whois(self, domain: str) -> tuple[bool, str]:
-        return self._socket_request(self.whois_host, WHOIS_PORT, domain)
+    def whois(self, domain: str, follow_referral: bool = False) -> tuple[bool, str]:
+        """Whois-oppslag; Norid er autoritativ for .no, så henvisninger følges bare på forespørsel"""
+        success, result = self._socket_request(self.whois_host, WHOIS_PORT, domain)
+        referral = _whois_referral(result, self.whois_host) if success and follow_referral else None
+        if referral is None:
+            return success, result
+        return self._socket_request(referral, WHOIS_PORT, domain)
 
     def das(self, domain: str) -> tuple[bool, str]:
         return self._socket_request(self.das_host, DAS_PORT, domain)
 
+    async def awhois(self, domain: str, follow_referral: bool = False) -> tuple[bool, str]:
+        success, result = await self._socket_request_aio(self.whois_host, WHOIS_PORT, domain)
+        referral = _whois_referral(result, self.whois_host) if success and follow_referral else None
+        if referral is None:
+            return success, result
+        return await self._socket_request_aio(referral, WHOIS_PORT, domain)
+
+    async def adas(self, domain: str) -> tuple[bool, str]:
+        return await self._socket_request_aio(self.das_host, DAS_PORT, domain)
+
     def dns_lookup(self, domain: str) -> tuple[bool, Dict[str, list]]:
-        """Hent DNS-records for et domene"""
-        records = {}
-        record_types = ['A', 'AAAA', 'MX', 'NS', 'TXT', 'CNAME']
+        """Hent DNS-records for et domene, via cache (lagres så lenge laveste record-TTL)"""
+        key = ("dns", "", domain.lower())
+        result = self._cache_get(key)
+        if result is None:
+            ttls = []
+            result = self._dns_query(domain, ttls)
+            self._cache_set(key, result, min(ttls, default=DNS_CACHE_TTL))
+        return result
+
+    def _dns_query(self, domain: str, ttls: list) -> tuple[bool, Dict[str, list]]:
+        """Slå opp DNS-records (alle record-typer samtidig); record-TTL legges i ttls"""
+        record_types = DNS_RECORD_TYPES
         
-        if DNS_AVAILABLE and dns_resolver:
-            for rtype in record_types:
+        if DNS_AVAILABLE:
+            import dns.resolver as dns_resolver
+
+            def lookup(rtype: str) -> Optional[list]:
                 try:
                     answers = dns_resolver.resolve(domain, rtype)
-                    records[rtype] = [str(r) for r in answers]
-                except dns_resolver.NoAnswer:
-                    pass
-                except dns_resolver.NXDOMAIN:
-                    return False, f"Domenet {domain} finnes ikke"
-                except dns_resolver.NoNameservers:
-                    return False, f"Ingen navneservere svarer for {domain}"
+                    ttls.append(answers.rrset.ttl)
+                    return [str(r) for r in answers]
+                except (dns_resolver.NXDOMAIN, dns_resolver.NoNameservers):
+                    raise
                 except Exception:
-                    pass
+                    return None
+
+            try:
+                records = _lookup_record_types(record_types, lookup)
+            except dns_resolver.NXDOMAIN:
+                return False, f"Domenet {domain} finnes ikke"
+            except dns_resolver.NoNameservers:
+                return False, f"Ingen navneservere svarer for {domain}"
         else:
-            # Fallback: Google DNS-over-HTTPS
-            for rtype in record_types:
-                try:
-                    url = f"https://dns.google/resolve?name={domain}&type={rtype}"
-                    response = requests.get(url, timeout=10)
-                    if response.status_code == 200:
-                        data = response.json()
-                        if data.get("Answer"):
-                            records[rtype] = [a["data"] for a in data["Answer"]]
-                except Exception:
-                    pass
+            records = _lookup_record_types(record_types, lambda rtype: self._doh_lookup(domain, rtype, ttls))
         
         if not records:
             return False, "Ingen DNS-records funnet"
         
         return True, records
 
+    async def adns_lookup(self, domain: str) -> tuple[bool, Dict[str, list]]:
+        """Som dns_lookup, men uten å blokkere event-loopen"""
+        key = ("dns", "", domain.lower())
+        result = self._cache_get(key)
+        if result is None:
+            ttls = []
+            result = await self._dns_query_aio(domain, ttls)
+            self._cache_set(key, result, min(ttls, default=DNS_CACHE_TTL))
+        return result
+
+    async def _dns_query_aio(self, domain: str, ttls: list) -> tuple[bool, Dict[str, list]]:
+        """Som _dns_query, med dnspythons asynkrone resolver (alle record-typer samtidig)"""
+        if not DNS_AVAILABLE:
+            # DoH-oppslagene kjøres i klientens trådpool, uten en ny pool per oppslag
+            loop = asyncio.get_running_loop()
+            answers = await asyncio.gather(
+                *(loop.run_in_executor(self._pool, self._doh_lookup, domain, rtype, ttls)
+                  for rtype in DNS_RECORD_TYPES)
+            )
+            records = {rtype: answer for rtype, answer in zip(DNS_RECORD_TYPES, answers) if answer}
+            if not records:
+                return False, "Ingen DNS-records funnet"
+            return True, records
+
+        import dns.asyncresolver
+        import dns.resolver as dns_resolver
+
+        answers = await asyncio.gather(
+            *(dns.asyncresolver.resolve(domain, rtype) for rtype in DNS_RECORD_TYPES),
+            return_exceptions=True
+        )
 
-class LoadingIndicator(ctk.CTkFrame):
-    """Animert loading-indikator"""
-    
-    def __init__(self, parent, text="Laster...", **kwargs):
-        super().__init__(parent, fg_color="transparent", **kwargs)
-        
-        self.label = ctk.CTkLabel(
-            self,
-            text=text,
-            font=ctk.CTkFont(size=14),
-            text_color=COLORS["text_muted"]
+        records = {}
+        for rtype, answer in zip(DNS_RECORD_TYPES, answers):
+            if isinstance(answer, dns_resolver.NXDOMAIN):
+                return False, f"Domenet {domain} finnes ikke"
+            if isinstance(answer, dns_resolver.NoNameservers):
+                return False, f"Ingen navneservere svarer for {domain}"
+            if isinstance(answer, BaseException):
+                continue
+            ttls.append(answer.rrset.ttl)
+            records[rtype] = [str(r) for r in answer]
+
+        if not records:
+            return False, "Ingen DNS-records funnet"
+
+        return True, records
+
+    def _doh_lookup(self, domain: str, rtype: str, ttls: list) -> Optional[list]:
+        """Fallback: slå opp én record-type via Google DNS-over-HTTPS"""
+        try:
+            url = f"https://dns.google/resolve?name={domain}&type={rtype}"
+            response = self._doh_session.get(url, timeout=10)
+            if response.status_code == 200:
+                data = parse_json(response.content)
+                if data.get("Answer"):
+                    ttls.extend(a["TTL"] for a in data["Answer"] if "TTL" in a)
+                    return [a["data"] for a in data["Answer"]]
+        except Exception:
+            pass
+        return None
+
+    @cached_property
+    def _doh_session(self):
+        """HTTP-sesjon for DNS-over-HTTPS; record-typene hentes over samme forbindelse"""
+        return _http_session({
+            "Accept": "application/dns-json",
+            "User-Agent": "Norid-GUI/1.0.0"
+        })
+
+
+# Gyldig .no-domene (etter IDNA-koding); hver etikett er 1–63 tegn
+_DOMAIN_RE = re.compile(r"^(?:[a-z0-9](?:[a-z0-9-]{0,61}[a-z0-9])?\.)+no$")
+
+
+def _http_session(headers: dict):
+    """HTTP-klient med HTTP/2 hvis httpx er installert, ellers requests"""
+    headers = {"Accept-Encoding": ACCEPT_ENCODING, **headers}
+    if HTTPX_AVAILABLE:
+        import httpx
+
+        # Samtidige forespørsler deler én TLS-forbindelse
+        return httpx.Client(
+            http2=True,
+            headers=headers,
+            timeout=30,
+            limits=httpx.Limits(max_keepalive_connections=8, keepalive_expiry=60),
         )
-        self.label.pack()
-        
-        self.dots = 0
-        self.base_text = text
-        self.animating = False
-    
-    def start(self, text="Laster"):
-        """Start animasjon"""
-        self.base_text = text
-        self.animating = True
-        self._animate()
+
+    import requests
+    from requests.adapters import HTTPAdapter
+
+    # Én gjenbrukbar forbindelse per arbeidstråd (standard er 10)
+    session = requests.Session()
+    session.mount("https://", HTTPAdapter(pool_connections=1, pool_maxsize=CLIENT_POOL_SIZE))
+    session.headers.update(headers)
+    return session
+
+
+def parse_json(content: bytes) -> Any:
+    """Tolk JSON-svar (med orjson hvis tilgjengelig)"""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(content)
+    return json.loads(content)
+
+
+def format_json(data: Any) -> str:
+    """Formater data som JSON (med orjson hvis tilgjengelig)"""
+    if ORJSON_AVAILABLE:
+        try:
+            return orjson.dumps(data, option=orjson.OPT_INDENT_2).decode("utf-8")
+        except TypeError:
+            pass
+    return json.dumps(data, indent=2, ensure_ascii=False)
+
+
+# Nøkkelord i DAS-svar, gjenkjent i én passering over svaret. Lengre fraser
+# står først, så «not available» vinner over «available» på samme posisjon.
+_DAS_KEYWORDS_RE = re.compile(
+    r"not available|not registered|available|registered|delegated|invalid",
+    re.IGNORECASE,
+)
+
+
+def classify_das(response: str) -> Optional[str]:
+    """Klassifiser DAS-svar som "available", "taken", "invalid" eller None (ukjent)"""
+    found = {match.lower() for match in _DAS_KEYWORDS_RE.findall(response)}
+
+    if ("available" in found and "not available" not in found) or "not registered" in found:
+        return "available"
+    if "registered" in found or "delegated" in found:
+        return "taken"
+    if "invalid" in found:
+        return "invalid"
+    return None
+
+
+def _encode_query(query: str) -> bytes:
+    """Lag whois/DAS-spørring; domener med æ, ø, å osv. sendes som punycode"""
+    try:
+        return f"{query}\r\n".encode("ascii")
+    except UnicodeEncodeError:
+        pass
+    if "." in query and not any(ch.isspace() for ch in query):
+        try:
+            return f"{query.encode('idna').decode('ascii')}\r\n".encode("ascii")
+        except UnicodeError:
+            pass
+    # Ikke et domenenavn; send som det er
+    return f"{query}\r\n".encode("utf-8")
+
+
+def _validate_domain(domain: str) -> bool:
+    """Sjekk at domain er et gyldig .no-domene (også med æ, ø, å osv.)"""
+    if not domain.isascii():
+        try:
+            domain = domain.encode("idna").decode("ascii")
+        except UnicodeError:
+            return False
+    return len(domain) <= 253 and _DOMAIN_RE.match(domain) is not None
+
+
+# Henvisning til annen whois-server («Referral URL:» eller «whois:»)
+_REFERRAL_RE = re.compile(
+    r"^\s*(?:referral url|whois):\s*(?:r?whois://)?([a-z0-9.-]+)",
+    re.IGNORECASE | re.MULTILINE,
+)
+
+
+def _whois_referral(response: str, current_host: str) -> Optional[str]:
+    """Finn whois-serveren svaret henviser til (None hvis ingen ny server)"""
+    match = _REFERRAL_RE.search(response)
+    if match is None:
+        return None
+    host = match.group(1).lower().rstrip(".")
+    return host if host and host != current_host else None
+
+
+def _recv_buffer() -> memoryview:
+    """Lesebuffer for whois/DAS i denne tråden (opprettes ved første bruk)"""
+    buffer = getattr(_recv_buffers, "buffer", None)
+    if buffer is None:
+        buffer = _recv_buffers.buffer = memoryview(bytearray(SOCKET_RECV_SIZE))
+    return buffer
+
+
+def _resolve(host: str) -> str:
+    """Slå opp IPv4-adressen til host (mellomlagres i ADDRESS_CACHE_TTL sekunder)"""
+    cached = _address_cache.get(host)
+    if cached and cached[0] > time.monotonic():
+        return cached[1]
     
-    def stop(self):
-        """Stopp animasjon"""
-        self.animating = False
+    try:
+        address = socket.getaddrinfo(host, None, socket.AF_INET, socket.SOCK_STREAM)[0][4][0]
+    except socket.gaierror:
+        # Navneoppslaget feilet; bruk forrige adresse hvis vi har en
+        if cached:
+            return cached[1]
+        raise
+    _address_cache[host] = (time.monotonic() + ADDRESS_CACHE_TTL, address)
+    return address
+
+
+def _socket_alive(sock: socket.socket) -> bool:
+    """Sjekk at en ubrukt forbindelse fortsatt er åpen (uten å lese data)"""
+    try:
+        sock.setblocking(False)
+        try:
+            # Tom lesing betyr at serveren har lukket; data betyr noe uventet
+            sock.recv(1, socket.MSG_PEEK)
+            return False
+        finally:
+            sock.settimeout(30)
+    except BlockingIOError:
+        return True
+    except OSError:
+        return False
+
+
+async def _read_response(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> str:
+    """Send det som er skrevet, og les svaret til serveren lukker forbindelsen"""
+    await writer.drain()
+
+    response = bytearray()
+    while True:
+        data = await reader.read(SOCKET_RECV_SIZE)
+        if not data:
+            break
+        response += data
+        if len(response) > MAX_RESPONSE_SIZE:
+            raise ResponseTooLarge()
+
+    return response.decode("utf-8", errors="replace")
+
+
+def _lookup_record_types(record_types: list, lookup) -> Dict[str, list]:
+    """Kjør lookup(rtype) for alle record-typer samtidig
+
+    Resultatet beholder rekkefølgen i record_types. Feiler ett oppslag,
+    avbrytes resten og feilen sendes videre.
+    """
+    executor = ThreadPoolExecutor(max_workers=len(record_types))
+    futures = {executor.submit(lookup, rtype): rtype for rtype in record_types}
+    results = {}
+    try:
+        for future in as_completed(futures):
+            results[futures[future]] = future.result()
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
     
-    def _animate(self):
-        """Animer prikker"""
-        if not self.animating:
-            return
-        
-        self.dots = (self.dots + 1) % 4
-        dots_text = "." * self.dots
-        self.label.configure(text=f"{self.base_text}{dots_text}")
-        self.after(300, self._animate)
+    return {rtype: results[rtype] for rtype in record_types if results.get(rtype)}
 
 
 class ResultCard(ctk.CTkFrame):
@@ -233,7 +831,7 @@ class ResultCard(ctk.CTkFrame):
         self.icon_label = ctk.CTkLabel(
             self.content_frame,
             text="",
-            font=ctk.CTkFont(size=48, weight="bold"),
+            font=get_font(48, "bold"),
             text_color=COLORS["text_muted"]
         )
         self.icon_label.pack(pady=(0, 10))
@@ -242,7 +840,7 @@ class ResultCard(ctk.CTkFrame):
         self.main_label = ctk.CTkLabel(
             self.content_frame,
             text="Skriv inn et domenenavn",
-            font=ctk.CTkFont(size=22, weight="bold"),
+            font=get_font(22, "bold"),
             text_color=COLORS["text"]
         )
         self.main_label.pack(pady=(0, 5))
@@ -251,52 +849,73 @@ class ResultCard(ctk.CTkFrame):
         self.sub_label = ctk.CTkLabel(
             self.content_frame,
             text="og klikk 'Sjekk' for å se om det er ledig",
-            font=ctk.CTkFont(size=14),
+            font=get_font(14),
             text_color=COLORS["text_muted"]
         )
         self.sub_label.pack()
+        
+        # Tilstand som venter på å bli tegnet (se _show), og siste tegnede tilstand
+        self._pending = {}
+        self._applied = {}
+    
+    def _show(self, border: str, icon: str, icon_color: str, main: str, main_color: str, sub: str):
+        """Sett ny tilstand; tegnes samlet neste gang Tk er ledig"""
+        if not self._pending:
+            self.after_idle(self._apply_pending)
+        self._pending = {
+            "border": border,
+            "icon": icon,
+            "icon_color": icon_color,
+            "main": main,
+            "main_color": main_color,
+            "sub": sub,
+        }
+
+    def _apply_pending(self):
+        """Oppdater widgets med siste tilstand i én omgang (bare de som er endret)"""
+        state, self._pending = self._pending, {}
+        if not state:
+            return
+        applied, self._applied = self._applied, state
+        changed = {key for key, value in state.items() if applied.get(key) != value}
+        if "border" in changed:
+            self.configure(border_color=state["border"])
+        if changed & {"icon", "icon_color"}:
+            self.icon_label.configure(text=state["icon"], text_color=state["icon_color"])
+        if changed & {"main", "main_color"}:
+            self.main_label.configure(text=state["main"], text_color=state["main_color"])
+        if "sub" in changed:
+            self.sub_label.configure(text=state["sub"])
     
     def show_loading(self, domain: str):
         """Vis loading-tilstand"""
-        self.configure(border_color=COLORS["primary"])
-        self.icon_label.configure(text="...", text_color=COLORS["primary"])
-        self.main_label.configure(text=f"Sjekker {domain}", text_color=COLORS["text"])
-        self.sub_label.configure(text="Kobler til Norid...")
+        self._show(C_PRIMARY, "...", C_PRIMARY,
+                   f"Sjekker {domain}", C_TEXT, "Kobler til Norid...")
     
     def show_available(self, domain: str):
         """Vis ledig-tilstand"""
-        self.configure(border_color=COLORS["success"])
-        self.icon_label.configure(text="[OK]", text_color=COLORS["success"])
-        self.main_label.configure(text=domain, text_color=COLORS["success"])
-        self.sub_label.configure(text="Dette domenet er LEDIG for registrering")
+        self._show(C_SUCCESS, "[OK]", C_SUCCESS,
+                   domain, C_SUCCESS, "Dette domenet er LEDIG for registrering")
     
     def show_taken(self, domain: str):
         """Vis opptatt-tilstand"""
-        self.configure(border_color=COLORS["error"])
-        self.icon_label.configure(text="[X]", text_color=COLORS["error"])
-        self.main_label.configure(text=domain, text_color=COLORS["error"])
-        self.sub_label.configure(text="Dette domenet er allerede REGISTRERT")
+        self._show(C_ERROR, "[X]", C_ERROR,
+                   domain, C_ERROR, "Dette domenet er allerede REGISTRERT")
     
     def show_invalid(self, domain: str):
         """Vis ugyldig-tilstand"""
-        self.configure(border_color=COLORS["warning"])
-        self.icon_label.configure(text="[!]", text_color=COLORS["warning"])
-        self.main_label.configure(text=domain, text_color=COLORS["warning"])
-        self.sub_label.configure(text="Ugyldig domenenavn")
+        self._show(C_WARNING, "[!]", C_WARNING,
+                   domain, C_WARNING, "Ugyldig domenenavn")
     
     def show_error(self, message: str):
         """Vis feil-tilstand"""
-        self.configure(border_color=COLORS["error"])
-        self.icon_label.configure(text="[!]", text_color=COLORS["error"])
-        self.main_label.configure(text="Feil", text_color=COLORS["error"])
-        self.sub_label.configure(text=message)
+        self._show(C_ERROR, "[!]", C_ERROR,
+                   "Feil", C_ERROR, message)
     
     def reset(self):
         """Tilbakestill til standardtilstand"""
-        self.configure(border_color=COLORS["border"])
-        self.icon_label.configure(text="", text_color=COLORS["text_muted"])
-        self.main_label.configure(text="Skriv inn et domenenavn", text_color=COLORS["text"])
-        self.sub_label.configure(text="og klikk 'Sjekk' for å se om det er ledig")
+        self._show(C_BORDER, "", C_TEXT_MUTED,
+                   "Skriv inn et domenenavn", C_TEXT, "og klikk 'Sjekk' for å se om det er ledig")
 
 
 class NoridGUI(ctk.CTk):
@@ -314,6 +933,22 @@ class NoridGUI(ctk.CTk):
         # Klient
         self.client = NoridClient(use_test=False)
 
+        # Pågående innsetting av tekst i biter, per tekstboks
+        self._insert_jobs = {}
+
+        # Oppslag som venter på svar, som (type, spørring)
+        self._inflight = set()
+
+        # Formaterte visninger, som (visning, id(svar)) -> (svar, tekst), og siste
+        # viste svar per tekstboks, så JSON-bryteren kan bytte visning uten nytt oppslag
+        self._views = OrderedDict()
+        self._views_lock = threading.Lock()
+        self._shown = {}
+
+        # Event-loop for asynkrone oppslag (whois/DAS), kjører i egen tråd
+        self.loop = asyncio.new_event_loop()
+        threading.Thread(target=self.loop.run_forever, daemon=True).start()
+
         # Konfigurer grid
         self.grid_columnconfigure(0, weight=1)
         self.grid_rowconfigure(1, weight=1)
@@ -323,6 +958,15 @@ class NoridGUI(ctk.CTk):
         self._create_tabs()
         self._create_statusbar()
 
+        # Rydd opp tråder og forbindelser når vinduet lukkes
+        self.protocol("WM_DELETE_WINDOW", self._on_close)
+
+    def _on_close(self):
+        """Avbryt oppslag som venter i køen, stopp event-loopen og lukk vinduet"""
+        self.client.close(cancel_pending=True)
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self.destroy()
+
     def _create_header(self):
         """Opprett header med logo og innstillinger"""
         header_frame = ctk.CTkFrame(self, fg_color="transparent")
@@ -336,7 +980,7 @@ class NoridGUI(ctk.CTk):
         title_label = ctk.CTkLabel(
             title_frame,
             text="Norid",
-            font=ctk.CTkFont(size=32, weight="bold"),
+            font=get_font(32, "bold"),
             text_color=COLORS["text"]
         )
         title_label.pack(side="left")
@@ -345,7 +989,7 @@ class NoridGUI(ctk.CTk):
         version_label = ctk.CTkLabel(
             title_frame,
             text="  CLI",
-            font=ctk.CTkFont(size=16),
+            font=get_font(16),
             text_color=COLORS["accent"]
         )
         version_label.pack(side="left", pady=(8, 0))
@@ -353,7 +997,7 @@ class NoridGUI(ctk.CTk):
         subtitle_label = ctk.CTkLabel(
             header_frame,
             text="Slå opp .no-domener uten autentisering",
-            font=ctk.CTkFont(size=13),
+            font=get_font(13),
             text_color=COLORS["text_muted"]
         )
         subtitle_label.grid(row=1, column=0, sticky="w", pady=(2, 0))
@@ -365,7 +1009,7 @@ class NoridGUI(ctk.CTk):
         env_label = ctk.CTkLabel(
             env_frame,
             text="Miljø",
-            font=ctk.CTkFont(size=12),
+            font=get_font(12),
             text_color=COLORS["text_muted"]
         )
         env_label.pack(side="left", padx=(0, 12))
@@ -376,7 +1020,7 @@ class NoridGUI(ctk.CTk):
             values=["Produksjon", "Test"],
             variable=self.env_var,
             command=self._on_env_change,
-            font=ctk.CTkFont(size=12),
+            font=get_font(12),
             fg_color=COLORS["bg_card"],
             selected_color=COLORS["primary"],
             selected_hover_color=COLORS["primary_hover"],
@@ -385,6 +1029,20 @@ class NoridGUI(ctk.CTk):
         )
         self.env_menu.pack(side="left")
 
+        # Hent ferske data i stedet for mellomlagrede svar
+        self.refresh_var = ctk.BooleanVar(value=False)
+        refresh_check = ctk.CTkCheckBox(
+            env_frame,
+            text="Hent ferskt",
+            variable=self.refresh_var,
+            command=self._on_refresh_toggle,
+            font=get_font(12),
+            text_color=COLORS["text_muted"],
+            fg_color=COLORS["primary"],
+            hover_color=COLORS["primary_hover"]
+        )
+        refresh_check.pack(side="left", padx=(16, 0))
+
     def _create_tabs(self):
         """Opprett faner for ulike funksjoner"""
         self.tabview = ctk.CTkTabview(
@@ -415,6 +1073,115 @@ class NoridGUI(ctk.CTk):
         self._setup_whois_tab()
         self._setup_dns_tab()
 
+        # Tekstboks per fane, for lagring av hele svaret
+        self._result_boxes = {
+            "Domene": self.domain_result,
+            "Entitet": self.entity_result,
+            "Navneserver": self.ns_result,
+            "Whois": self.whois_result,
+            "DNS": self.dns_result,
+        }
+        self._full_texts = {}
+        if self.tk.call("tk", "windowingsystem") == "aqua":
+            self._save_hint = "⌘S"
+            self.bind("<Command-s>", self._save_result)
+        else:
+            self._save_hint = "Ctrl+S"
+            self.bind("<Control-s>", self._save_result)
+
+    def _add_lookup_input(self, input_frame, placeholder: str, on_run, button_text: str = "Slå opp",
+                          width: int = 380, json_switch: bool = False, on_toggle=None,
+                          **entry_options):
+        """Legg til søkefelt, knapp og eventuelt JSON-bryter; returnerer (entry, knapp, json_var)"""
+        entry_options.setdefault("font", get_font(14))
+        entry = ctk.CTkEntry(
+            input_frame,
+            placeholder_text=placeholder,
+            width=width,
+            height=44,
+            fg_color=COLORS["bg_input"],
+            border_color=COLORS["border"],
+            corner_radius=8,
+            **entry_options
+        )
+        entry.pack(side="left", padx=(0, 12))
+        on_run = self._debounced(on_run)
+        # «break» stopper autorepeterte Enter-trykk fra å gå videre til klassebindingene
+        entry.bind("<Return>", lambda e: on_run() or "break")
+
+        button = ctk.CTkButton(
+            input_frame,
+            text=button_text,
+            command=on_run,
+            width=100,
+            height=44,
+            font=get_font(14, "bold"),
+            fg_color=COLORS["primary"],
+            hover_color=COLORS["primary_hover"],
+            corner_radius=8
+        )
+        button.pack(side="left", padx=(0, 12) if json_switch else 0)
+
+        json_var = None
+        if json_switch:
+            json_var = ctk.BooleanVar(value=False)
+            ctk.CTkSwitch(
+                input_frame,
+                text="JSON",
+                variable=json_var,
+                command=on_toggle,
+                font=get_font(12),
+                text_color=COLORS["text_muted"],
+                progress_color=COLORS["primary"]
+            ).pack(side="left")
+
+        return entry, button, json_var
+
+    def _debounced(self, func):
+        """Pakk inn func så en serie kall tettere enn DEBOUNCE_MS gir ett kall (det første)"""
+        pending = None
+
+        def reset():
+            nonlocal pending
+            pending = None
+
+        def call():
+            nonlocal pending
+            if pending is None:
+                func()
+            else:
+                self.after_cancel(pending)
+            pending = self.after(DEBOUNCE_MS, reset)
+
+        return call
+
+    def _add_result_box(self, tab, row: int = 1, font_size: int = 13, text: str = "") -> ctk.CTkTextbox:
+        """Legg til skrivebeskyttet tekstboks for resultater nederst i fanen"""
+        textbox = ctk.CTkTextbox(
+            tab,
+            font=get_font(font_size, family=MONO_FAMILY),
+            fg_color=COLORS["bg_input"],
+            text_color=COLORS["text"],
+            border_color=COLORS["border"],
+            border_width=1,
+            corner_radius=8
+        )
+        textbox.grid(row=row, column=0, sticky="nsew", padx=24, pady=(0, 24))
+        if text:
+            textbox.insert("1.0", text)
+        textbox.configure(state="disabled")
+        return textbox
+
+    def _setup_lookup_tab(self, name: str, result_row: int = 1):
+        """Klargjør fane med inputrad øverst og resultat under; returnerer (fane, input_frame)"""
+        tab = self.tabview.tab(name)
+        tab.grid_columnconfigure(0, weight=1)
+        tab.grid_rowconfigure(result_row, weight=1)
+
+        input_frame = ctk.CTkFrame(tab, fg_color="transparent")
+        input_frame.grid(row=result_row - 1, column=0, pady=(24 if result_row == 1 else 0, 16))
+        return tab, input_frame
+
     def _setup_das_tab(self):
         """Sett opp DAS-fanen - sjekk om domene er ledig"""
         tab = self.tabview.tab("DAS")
@@ -429,7 +1196,7 @@ class NoridGUI(ctk.CTk):
         desc = ctk.CTkLabel(
             top_frame,
             text="Domain Availability Service",
-            font=ctk.CTkFont(size=16, weight="bold"),
+            font=get_font(16, "bold"),
             text_color=COLORS["text"]
         )
         desc.pack(pady=(0, 4))
@@ -437,7 +1204,7 @@ class NoridGUI(ctk.CTk):
         desc_sub = ctk.CTkLabel(
             top_frame,
             text="Sjekk om et .no-domene er ledig for registrering",
-            font=ctk.CTkFont(size=13),
+            font=get_font(13),
             text_color=COLORS["text_muted"]
         )
         desc_sub.pack(pady=(0, 16))
@@ -446,33 +1213,24 @@ class NoridGUI(ctk.CTk):
         input_frame = ctk.CTkFrame(top_frame, fg_color="transparent")
         input_frame.pack()
 
-        self.das_entry = ctk.CTkEntry(
-            input_frame,
-            placeholder_text="domenenavn.no",
-            width=380,
-            height=44,
-            font=ctk.CTkFont(size=15),
-            fg_color=COLORS["bg_input"],
-            border_color=COLORS["border"],
-            text_color=COLORS["text"],
-            placeholder_text_color=COLORS["text_muted"],
-            corner_radius=8
+        self.das_entry, self.das_button, _ = self._add_lookup_input(
+            input_frame, "domenenavn.no", self._run_das, button_text="Sjekk",
+            font=get_font(15), text_color=COLORS["text"], placeholder_text_color=COLORS["text_muted"]
         )
-        self.das_entry.pack(side="left", padx=(0, 12))
-        self.das_entry.bind("<Return>", lambda e: self._run_das())
 
-        self.das_button = ctk.CTkButton(
+        # Slå opp i alle tjenester på én gang (resultatene vises i hver sin fane)
+        self.all_button = ctk.CTkButton(
             input_frame,
-            text="Sjekk",
-            command=self._run_das,
-            width=100,
+            text="Slå opp alt",
+            command=self._debounced(self._run_all),
+            width=120,
             height=44,
-            font=ctk.CTkFont(size=14, weight="bold"),
-            fg_color=COLORS["primary"],
-            hover_color=COLORS["primary_hover"],
+            font=get_font(14, "bold"),
+            fg_color=COLORS["bg_input"],
+            hover_color=COLORS["border"],
             corner_radius=8
         )
-        self.das_button.pack(side="left")
+        self.all_button.pack(side="left", padx=(12, 0))
 
         # Resultatkort
         self.das_result_card = ResultCard(tab)
@@ -480,135 +1238,34 @@ class NoridGUI(ctk.CTk):
 
     def _setup_domain_tab(self):
         """Sett opp domeneoppslag-fanen"""
-        tab = self.tabview.tab("Domene")
-        tab.grid_columnconfigure(0, weight=1)
-        tab.grid_rowconfigure(1, weight=1)
-
-        # Input-ramme
-        input_frame = ctk.CTkFrame(tab, fg_color="transparent")
-        input_frame.grid(row=0, column=0, pady=(24, 16))
-
-        self.domain_entry = ctk.CTkEntry(
-            input_frame,
-            placeholder_text="Domenenavn (f.eks. norid.no)",
-            width=380,
-            height=44,
-            font=ctk.CTkFont(size=14),
-            fg_color=COLORS["bg_input"],
-            border_color=COLORS["border"],
-            corner_radius=8
+        tab, input_frame = self._setup_lookup_tab("Domene")
+        self.domain_entry, self.domain_button, self.domain_json_var = self._add_lookup_input(
+            input_frame, "Domenenavn (f.eks. norid.no)", self._run_domain, json_switch=True,
+            on_toggle=lambda: self._on_view_toggle(self.domain_result, self.domain_json_var)
         )
-        self.domain_entry.pack(side="left", padx=(0, 12))
-        self.domain_entry.bind("<Return>", lambda e: self._run_domain())
-
-        self.domain_button = ctk.CTkButton(
-            input_frame,
-            text="Slå opp",
-            command=self._run_domain,
-            width=100,
-            height=44,
-            font=ctk.CTkFont(size=14, weight="bold"),
-            fg_color=COLORS["primary"],
-            hover_color=COLORS["primary_hover"],
-            corner_radius=8
-        )
-        self.domain_button.pack(side="left", padx=(0, 12))
-
-        self.domain_json_var = ctk.BooleanVar(value=False)
-        self.domain_json_check = ctk.CTkSwitch(
-            input_frame,
-            text="JSON",
-            variable=self.domain_json_var,
-            font=ctk.CTkFont(size=12),
-            text_color=COLORS["text_muted"],
-            progress_color=COLORS["primary"]
-        )
-        self.domain_json_check.pack(side="left")
-
-        # Resultat
-        self.domain_result = ctk.CTkTextbox(
-            tab,
-            font=ctk.CTkFont(family="SF Mono, Menlo, Monaco, Consolas, monospace", size=13),
-            fg_color=COLORS["bg_input"],
-            text_color=COLORS["text"],
-            border_color=COLORS["border"],
-            border_width=1,
-            corner_radius=8
-        )
-        self.domain_result.grid(row=1, column=0, sticky="nsew", padx=24, pady=(0, 24))
+        self.domain_result = self._add_result_box(tab)
 
     def _setup_entity_tab(self):
         """Sett opp entitetsoppslag-fanen"""
-        tab = self.tabview.tab("Entitet")
-        tab.grid_columnconfigure(0, weight=1)
-        tab.grid_rowconfigure(1, weight=1)
-
-        # Input-ramme
-        input_frame = ctk.CTkFrame(tab, fg_color="transparent")
-        input_frame.grid(row=0, column=0, pady=(24, 16))
+        tab, input_frame = self._setup_lookup_tab("Entitet")
 
         label = ctk.CTkLabel(
             input_frame,
             text="Handle:",
-            font=ctk.CTkFont(size=13),
+            font=get_font(13),
             text_color=COLORS["text_muted"]
         )
         label.pack(side="left", padx=(0, 12))
 
-        self.entity_entry = ctk.CTkEntry(
-            input_frame,
-            placeholder_text="f.eks. reg1-NORID",
-            width=320,
-            height=44,
-            font=ctk.CTkFont(size=14),
-            fg_color=COLORS["bg_input"],
-            border_color=COLORS["border"],
-            corner_radius=8
-        )
-        self.entity_entry.pack(side="left", padx=(0, 12))
-        self.entity_entry.bind("<Return>", lambda e: self._run_entity())
-
-        self.entity_button = ctk.CTkButton(
-            input_frame,
-            text="Slå opp",
-            command=self._run_entity,
-            width=100,
-            height=44,
-            font=ctk.CTkFont(size=14, weight="bold"),
-            fg_color=COLORS["primary"],
-            hover_color=COLORS["primary_hover"],
-            corner_radius=8
-        )
-        self.entity_button.pack(side="left", padx=(0, 12))
-
-        self.entity_json_var = ctk.BooleanVar(value=False)
-        self.entity_json_check = ctk.CTkSwitch(
-            input_frame,
-            text="JSON",
-            variable=self.entity_json_var,
-            font=ctk.CTkFont(size=12),
-            text_color=COLORS["text_muted"],
-            progress_color=COLORS["primary"]
-        )
-        self.entity_json_check.pack(side="left")
-
-        # Resultat
-        self.entity_result = ctk.CTkTextbox(
-            tab,
-            font=ctk.CTkFont(family="SF Mono, Menlo, Monaco, Consolas, monospace", size=13),
-            fg_color=COLORS["bg_input"],
-            text_color=COLORS["text"],
-            border_color=COLORS["border"],
-            border_width=1,
-            corner_radius=8
+        self.entity_entry, self.entity_button, self.entity_json_var = self._add_lookup_input(
+            input_frame, "f.eks. reg1-NORID", self._run_entity, width=320, json_switch=True,
+            on_toggle=lambda: self._on_view_toggle(self.entity_result, self.entity_json_var)
         )
-        self.entity_result.grid(row=1, column=0, sticky="nsew", padx=24, pady=(0, 24))
+        self.entity_result = self._add_result_box(tab)
 
     def _setup_nameserver_tab(self):
         """Sett opp navneserver-fanen"""
-        tab = self.tabview.tab("Navneserver")
-        tab.grid_columnconfigure(0, weight=1)
-        tab.grid_rowconfigure(2, weight=1)
+        tab, input_frame = self._setup_lookup_tab("Navneserver", result_row=2)
 
         # Valg mellom oppslag og søk
         mode_frame = ctk.CTkFrame(tab, fg_color="transparent")
@@ -616,166 +1273,40 @@ class NoridGUI(ctk.CTk):
 
         self.ns_mode = ctk.StringVar(value="handle")
         
-        handle_radio = ctk.CTkRadioButton(
-            mode_frame,
-            text="Oppslag via handle",
-            variable=self.ns_mode,
-            value="handle",
-            font=ctk.CTkFont(size=13),
-            text_color=COLORS["text"],
-            fg_color=COLORS["primary"],
-            hover_color=COLORS["primary_hover"]
-        )
-        handle_radio.pack(side="left", padx=(0, 24))
-        
-        search_radio = ctk.CTkRadioButton(
-            mode_frame,
-            text="Søk via hostname",
-            variable=self.ns_mode,
-            value="search",
-            font=ctk.CTkFont(size=13),
-            text_color=COLORS["text"],
-            fg_color=COLORS["primary"],
-            hover_color=COLORS["primary_hover"]
-        )
-        search_radio.pack(side="left")
-
-        # Input-ramme
-        input_frame = ctk.CTkFrame(tab, fg_color="transparent")
-        input_frame.grid(row=1, column=0, pady=(0, 16))
-
-        self.ns_entry = ctk.CTkEntry(
-            input_frame,
-            placeholder_text="X11H-NORID eller *.nic.no",
-            width=380,
-            height=44,
-            font=ctk.CTkFont(size=14),
-            fg_color=COLORS["bg_input"],
-            border_color=COLORS["border"],
-            corner_radius=8
+        for text, value, padx in (("Oppslag via handle", "handle", (0, 24)),
+                                  ("Søk via hostname", "search", 0)):
+            ctk.CTkRadioButton(
+                mode_frame,
+                text=text,
+                variable=self.ns_mode,
+                value=value,
+                font=get_font(13),
+                text_color=COLORS["text"],
+                fg_color=COLORS["primary"],
+                hover_color=COLORS["primary_hover"]
+            ).pack(side="left", padx=padx)
+
+        self.ns_entry, self.ns_button, self.ns_json_var = self._add_lookup_input(
+            input_frame, "X11H-NORID eller *.nic.no", self._run_nameserver, button_text="Søk",
+            json_switch=True,
+            on_toggle=lambda: self._on_view_toggle(self.ns_result, self.ns_json_var)
         )
-        self.ns_entry.pack(side="left", padx=(0, 12))
-        self.ns_entry.bind("<Return>", lambda e: self._run_nameserver())
-
-        self.ns_button = ctk.CTkButton(
-            input_frame,
-            text="Søk",
-            command=self._run_nameserver,
-            width=100,
-            height=44,
-            font=ctk.CTkFont(size=14, weight="bold"),
-            fg_color=COLORS["primary"],
-            hover_color=COLORS["primary_hover"],
-            corner_radius=8
-        )
-        self.ns_button.pack(side="left", padx=(0, 12))
-
-        self.ns_json_var = ctk.BooleanVar(value=False)
-        self.ns_json_check = ctk.CTkSwitch(
-            input_frame,
-            text="JSON",
-            variable=self.ns_json_var,
-            font=ctk.CTkFont(size=12),
-            text_color=COLORS["text_muted"],
-            progress_color=COLORS["primary"]
-        )
-        self.ns_json_check.pack(side="left")
-
-        # Resultat
-        self.ns_result = ctk.CTkTextbox(
-            tab,
-            font=ctk.CTkFont(family="SF Mono, Menlo, Monaco, Consolas, monospace", size=13),
-            fg_color=COLORS["bg_input"],
-            text_color=COLORS["text"],
-            border_color=COLORS["border"],
-            border_width=1,
-            corner_radius=8
-        )
-        self.ns_result.grid(row=2, column=0, sticky="nsew", padx=24, pady=(0, 24))
+        self.ns_result = self._add_result_box(tab, row=2)
 
     def _setup_whois_tab(self):
         """Sett opp whois-fanen"""
-        tab = self.tabview.tab("Whois")
-        tab.grid_columnconfigure(0, weight=1)
-        tab.grid_rowconfigure(1, weight=1)
-
-        # Input-ramme
-        input_frame = ctk.CTkFrame(tab, fg_color="transparent")
-        input_frame.grid(row=0, column=0, pady=(24, 16))
-
-        self.whois_entry = ctk.CTkEntry(
-            input_frame,
-            placeholder_text="Domenenavn (f.eks. norid.no)",
-            width=380,
-            height=44,
-            font=ctk.CTkFont(size=14),
-            fg_color=COLORS["bg_input"],
-            border_color=COLORS["border"],
-            corner_radius=8
-        )
-        self.whois_entry.pack(side="left", padx=(0, 12))
-        self.whois_entry.bind("<Return>", lambda e: self._run_whois())
-
-        self.whois_button = ctk.CTkButton(
-            input_frame,
-            text="Slå opp",
-            command=self._run_whois,
-            width=100,
-            height=44,
-            font=ctk.CTkFont(size=14, weight="bold"),
-            fg_color=COLORS["primary"],
-            hover_color=COLORS["primary_hover"],
-            corner_radius=8
+        tab, input_frame = self._setup_lookup_tab("Whois")
+        self.whois_entry, self.whois_button, _ = self._add_lookup_input(
+            input_frame, "Domenenavn (f.eks. norid.no)", self._run_whois
         )
-        self.whois_button.pack(side="left")
-
-        # Resultat
-        self.whois_result = ctk.CTkTextbox(
-            tab,
-            font=ctk.CTkFont(family="SF Mono, Menlo, Monaco, Consolas, monospace", size=12),
-            fg_color=COLORS["bg_input"],
-            text_color=COLORS["text"],
-            border_color=COLORS["border"],
-            border_width=1,
-            corner_radius=8
-        )
-        self.whois_result.grid(row=1, column=0, sticky="nsew", padx=24, pady=(0, 24))
+        self.whois_result = self._add_result_box(tab, font_size=12)
 
     def _setup_dns_tab(self):
         """Sett opp DNS-fanen"""
-        tab = self.tabview.tab("DNS")
-        tab.grid_columnconfigure(0, weight=1)
-        tab.grid_rowconfigure(1, weight=1)
-
-        # Input-ramme
-        input_frame = ctk.CTkFrame(tab, fg_color="transparent")
-        input_frame.grid(row=0, column=0, pady=(24, 16))
-
-        self.dns_entry = ctk.CTkEntry(
-            input_frame,
-            placeholder_text="Domenenavn (f.eks. norid.no)",
-            width=380,
-            height=44,
-            font=ctk.CTkFont(size=14),
-            fg_color=COLORS["bg_input"],
-            border_color=COLORS["border"],
-            corner_radius=8
-        )
-        self.dns_entry.pack(side="left", padx=(0, 12))
-        self.dns_entry.bind("<Return>", lambda e: self._run_dns())
-
-        self.dns_button = ctk.CTkButton(
-            input_frame,
-            text="Slå opp",
-            command=self._run_dns,
-            width=100,
-            height=44,
-            font=ctk.CTkFont(size=14, weight="bold"),
-            fg_color=COLORS["primary"],
-            hover_color=COLORS["primary_hover"],
-            corner_radius=8
+        tab, input_frame = self._setup_lookup_tab("DNS")
+        self.dns_entry, self.dns_button, _ = self._add_lookup_input(
+            input_frame, "Domenenavn (f.eks. norid.no)", self._run_dns
         )
-        self.dns_button.pack(side="left")
 
         # JSON checkbox
         self.dns_json_var = ctk.BooleanVar(value=False)
@@ -783,25 +1314,18 @@ class NoridGUI(ctk.CTk):
             input_frame,
             text="Vis som JSON",
             variable=self.dns_json_var,
-            font=ctk.CTkFont(size=12),
+            command=lambda: self._on_view_toggle(self.dns_result, self.dns_json_var),
+            font=get_font(12),
             text_color=COLORS["text_muted"],
             fg_color=COLORS["primary"],
             hover_color=COLORS["primary_hover"]
         )
         json_check.pack(side="left", padx=(16, 0))
 
-        # Resultat
-        self.dns_result = ctk.CTkTextbox(
-            tab,
-            font=ctk.CTkFont(family="SF Mono, Menlo, Monaco, Consolas, monospace", size=12),
-            fg_color=COLORS["bg_input"],
-            text_color=COLORS["text"],
-            border_color=COLORS["border"],
-            border_width=1,
-            corner_radius=8
+        self.dns_result = self._add_result_box(
+            tab, font_size=12,
+            text="Skriv inn et domenenavn for å hente DNS-records\n\nViser: A, AAAA, MX, NS, TXT, CNAME"
         )
-        self.dns_result.grid(row=1, column=0, sticky="nsew", padx=24, pady=(0, 24))
-        self.dns_result.insert("1.0", "Skriv inn et domenenavn for å hente DNS-records\n\nViser: A, AAAA, MX, NS, TXT, CNAME")
 
     def _create_statusbar(self):
         """Opprett statuslinje"""
@@ -812,7 +1336,7 @@ class NoridGUI(ctk.CTk):
         self.statusbar = ctk.CTkLabel(
             status_frame,
             text="Klar",
-            font=ctk.CTkFont(size=12),
+            font=get_font(12),
             text_color=COLORS["text_muted"]
         )
         self.statusbar.pack(side="left", padx=24, pady=8)
@@ -821,7 +1345,7 @@ class NoridGUI(ctk.CTk):
         self.env_indicator = ctk.CTkLabel(
             status_frame,
             text="rdap.norid.no",
-            font=ctk.CTkFont(size=11),
+            font=get_font(11),
             text_color=COLORS["text_muted"]
         )
         self.env_indicator.pack(side="right", padx=24, pady=8)
@@ -829,7 +1353,8 @@ class NoridGUI(ctk.CTk):
     def _on_env_change(self, value: str):
         """Håndter miljøbytte"""
         use_test = value == "Test"
-        self.client = NoridClient(use_test=use_test)
+        self.client.close()
+        self.client = NoridClient(use_test=use_test, use_cache=not self.refresh_var.get())
         
         if use_test:
             self._set_status("Byttet til testmiljø")
@@ -838,23 +1363,161 @@ class NoridGUI(ctk.CTk):
             self._set_status("Byttet til produksjonsmiljø")
             self.env_indicator.configure(text="rdap.norid.no", text_color=COLORS["text_muted"])
 
+    def _on_refresh_toggle(self):
+        """Slå mellomlagring av oppslag av eller på"""
+        self.client.use_cache = not self.refresh_var.get()
+
     def _set_status(self, text: str):
         """Oppdater statuslinjen"""
         self.statusbar.configure(text=text)
 
-    def _run_in_thread(self, func):
-        """Kjør funksjon i egen tråd"""
-        thread = threading.Thread(target=func, daemon=True)
-        thread.start()
+    def _begin(self, key: tuple) -> bool:
+        """Registrer et oppslag; False hvis det samme oppslaget allerede pågår"""
+        if key in self._inflight:
+            return False
+        self._inflight.add(key)
+        return True
+
+    def _run_in_thread(self, func) -> Future:
+        """Kjør funksjon i klientens trådpool"""
+        return self.client.submit(func)
+
+    def _render_safe(self, kind: str, query: str, success: bool, result, as_json: bool) -> tuple[bool, str]:
+        """Som _render, men en formateringsfeil blir en feilmelding i stedet for et unntak som forsvinner i Future"""
+        if not success:
+            return False, result
+        try:
+            return True, self._render(kind, query, result, as_json)
+        except Exception as e:
+            return False, f"Kunne ikke vise svaret: {str(e)}"
+
+    def _render(self, kind: str, query: str, result, as_json: bool) -> str:
+        """Formater et vellykket svar; samme svar i samme visning formateres bare én gang"""
+        view = "json" if as_json else kind
+        key = (view, id(result))
+        with self._views_lock:
+            entry = self._views.get(key)
+            if entry is not None and entry[0] is result:
+                self._views.move_to_end(key)
+                return entry[1]
+
+        if as_json:
+            text = format_json(result)
+        elif kind == "domain":
+            text = self._format_domain(result)
+        elif kind == "entity":
+            text = self._format_entity(result)
+        elif kind == "ns":
+            text = self._format_nameserver(result)
+        elif kind == "ns_search":
+            text = self._format_ns_search(result)
+        else:
+            text = self._format_dns(query, result)
+
+        with self._views_lock:
+            self._views[key] = (result, text)
+            if len(self._views) > CACHE_SIZE:
+                self._views.popitem(last=False)
+        return text
+
+    def _show_view(self, textbox, kind: str, query: str, result, text: str):
+        """Vis formatert svar og husk det for JSON-bryteren"""
+        self._shown[textbox] = (kind, query, result)
+        self._set_text(textbox, text)
+
+    def _on_view_toggle(self, textbox, json_var):
+        """Bytt mellom lesbar visning og JSON for svaret som vises"""
+        shown = self._shown.get(textbox)
+        if shown is None:
+            return
+        kind, query, result = shown
+        as_json = json_var.get()
+
+        def do_render():
+            text = self._render(kind, query, result, as_json)
+            self.after(0, self._set_text, textbox, text)
+
+        self._run_in_thread(do_render)
+
+    def _set_text(self, textbox, text: str):
+        """Erstatt innholdet i tekstboksen og stopp eventuell pågående innsetting
+
+        Første bit settes inn med en gang, resten settes inn i biter.
+        """
+        job = self._insert_jobs.pop(textbox, None)
+        if job is not None:
+            self.after_cancel(job)
+
+        self._full_texts[textbox] = text
+        if len(text) > MAX_DISPLAY_SIZE:
+            omitted = len(text) - MAX_DISPLAY_SIZE
+            text = (f"{text[:MAX_DISPLAY_SIZE]}\n\n… ({omitted} tegn til er utelatt – "
+                    f"trykk {self._save_hint} for å lagre hele svaret)\n")
+
+        # Boksen er skrivebeskyttet; åpnes bare rundt selve endringen
+        textbox.configure(state="normal")
+        textbox.delete("1.0", "end")
+        textbox.insert("1.0", text[:TEXT_CHUNK_SIZE])
+        textbox.configure(state="disabled")
+        if len(text) > TEXT_CHUNK_SIZE:
+            self._insert_jobs[textbox] = self.after(1, self._insert_chunks, textbox, text, TEXT_CHUNK_SIZE)
+
+    def _save_result(self, event=None):
+        """Lagre hele svaret i aktiv fane til fil (også det som er kuttet i visningen)"""
+        text = self._full_texts.get(self._result_boxes.get(self.tabview.get()))
+        if not text:
+            self._set_status("Ingenting å lagre i denne fanen")
+            return
+
+        path = filedialog.asksaveasfilename(
+            parent=self,
+            defaultextension=".txt",
+            filetypes=[("Tekst", "*.txt"), ("JSON", "*.json"), ("Alle filer", "*")]
+        )
+        if not path:
+            return
+
+        try:
+            with open(path, "w", encoding="utf-8") as f:
+                f.write(text)
+        except OSError as e:
+            self._set_status(f"Kunne ikke lagre: {e}")
+            return
+        self._set_status(f"Lagret {path}")
+
+    def _insert_chunks(self, textbox, text: str, start: int = 0):
+        """Sett inn tekst i biter, så Tk rekker å tegne mellom hver"""
+        textbox.configure(state="normal")
+        textbox.insert("end", text[start:start + TEXT_CHUNK_SIZE])
+        textbox.configure(state="disabled")
+        start += TEXT_CHUNK_SIZE
+        if start < len(text):
+            self._insert_jobs[textbox] = self.after(1, self._insert_chunks, textbox, text, start)
+        else:
+            self._insert_jobs.pop(textbox, None)
+
+    def _run_async(self, coro, callback) -> Future:
+        """Kjør coroutine i event-loopen og gi (success, result) til callback i Tk-tråden"""
+        future = asyncio.run_coroutine_threadsafe(coro, self.loop)
+
+        def done(future):
+            try:
+                success, result = future.result()
+            except Exception as e:
+                success, result = False, f"Uventet feil: {str(e)}"
+            self.after(0, callback, success, result)
+
+        future.add_done_callback(done)
+        return future
 
     # ========================================================================
     # DAS
     # ========================================================================
-    def _run_das(self):
-        """Kjør DAS-oppslag"""
-        domain = self.das_entry.get().strip()
+    def _das_domain(self) -> Optional[str]:
+        """Hent domenet fra DAS-feltet (med .no); None hvis feltet er tomt eller ugyldig"""
+        domain = self.das_entry.get().strip().lower()
         if not domain:
-            return
+            return None
 
         # Legg til .no hvis det mangler
         if not domain.endswith(".no"):
@@ -862,18 +1525,59 @@ class NoridGUI(ctk.CTk):
             self.das_entry.delete(0, "end")
             self.das_entry.insert(0, domain)
 
+        # Åpenbart ugyldige navn trenger ikke et oppslag
+        if not _validate_domain(domain):
+            self.das_result_card.show_invalid(domain)
+            self._set_status(f"Ugyldig domenenavn: {domain}")
+            return None
+
+        return domain
+
+    def _run_das(self):
+        """Kjør DAS-oppslag"""
+        domain = self._das_domain()
+        if domain is None:
+            return
+
+        if not self._begin(("das", domain)):
+            return
+
         self.das_button.configure(state="disabled", text="...")
         self.das_result_card.show_loading(domain)
         self._set_status(f"Sjekker {domain}...")
 
-        def do_request():
-            success, result = self.client.das(domain)
-            self.after(0, lambda: self._show_das_result(domain, success, result))
+        return self._run_async(
+            self.client.adas(domain),
+            lambda success, result: self._show_das_result(domain, success, result)
+        )
+
+    def _run_all(self):
+        """Slå opp domenet i DAS, RDAP, whois og DNS samtidig
+
+        Hvert oppslag går parallelt, og hver fane oppdateres så snart
+        svaret kommer. Når alle er ferdige, oppdateres statuslinjen.
+        """
+        domain = self._das_domain()
+        if domain is None:
+            return
+
+        for entry in (self.domain_entry, self.whois_entry, self.dns_entry):
+            entry.delete(0, "end")
+            entry.insert(0, domain)
+
+        futures = [future for future in (self._run_das(), self._run_domain(),
+                                         self._run_whois(), self._run_dns())
+                   if future is not None]
+
+        async def wait_all():
+            await asyncio.gather(*(asyncio.wrap_future(f) for f in futures), return_exceptions=True)
+            self.after(0, self._set_status, f"Alle oppslag fullført for {domain}")
 
-        self._run_in_thread(do_request)
+        asyncio.run_coroutine_threadsafe(wait_all(), self.loop)
 
     def _show_das_result(self, domain: str, success: bool, result: str):
         """Vis DAS-resultat"""
+        self._inflight.discard(("das", domain))
         self.das_button.configure(state="normal", text="Sjekk")
 
         if not success:
@@ -881,14 +1585,12 @@ class NoridGUI(ctk.CTk):
             self._set_status("Feil ved oppslag")
             return
 
-        result_lower = result.lower()
-        if "available" in result_lower and "not available" not in result_lower:
+        status = classify_das(result)
+        if status == "available":
             self.das_result_card.show_available(domain)
-        elif "not registered" in result_lower:
-            self.das_result_card.show_available(domain)
-        elif "registered" in result_lower or "delegated" in result_lower:
+        elif status == "taken":
             self.das_result_card.show_taken(domain)
-        elif "invalid" in result_lower:
+        elif status == "invalid":
             self.das_result_card.show_invalid(domain)
         else:
             self.das_result_card.show_error(f"Ukjent status: {result[:100]}")
@@ -904,81 +1606,72 @@ class NoridGUI(ctk.CTk):
         if not domain:
             return
 
+        if not self._begin(("domain", domain)):
+            return
+
         self.domain_button.configure(state="disabled", text="...")
         self._set_status(f"Slår opp {domain}...")
 
+        as_json = self.domain_json_var.get()
+
         def do_request():
             success, result = self.client.rdap_domain(domain)
-            self.after(0, lambda: self._show_domain_result(domain, success, result))
+            success, text = self._render_safe("domain", domain, success, result, as_json)
+            self.after(0, lambda: self._show_domain_result(domain, success, text, result))
 
-        self._run_in_thread(do_request)
+        return self._run_in_thread(do_request)
 
-    def _show_domain_result(self, domain: str, success: bool, result):
-        """Vis domeneoppslag-resultat"""
+    def _show_domain_result(self, domain: str, success: bool, result: str, data=None):
+        """Vis domeneoppslag-resultat (teksten er allerede formatert i arbeidstråden)"""
+        self._inflight.discard(("domain", domain))
         self.domain_button.configure(state="normal", text="Slå opp")
-        self.domain_result.delete("0.0", "end")
 
         if not success:
-            self.domain_result.insert("0.0", f"Feil: {result}")
+            self._shown.pop(self.domain_result, None)
+            self._set_text(self.domain_result, f"Feil: {result}")
             self._set_status("Feil ved oppslag")
             return
 
-        if self.domain_json_var.get():
-            self.domain_result.insert("0.0", json.dumps(result, indent=2, ensure_ascii=False))
-        else:
-            self.domain_result.insert("0.0", self._format_domain(result))
-
+        self._show_view(self.domain_result, "domain", domain, data, result)
         self._set_status(f"Oppslag fullført for {domain}")
 
     def _format_domain(self, data: Dict) -> str:
         """Formater domenedata til lesbar tekst"""
-        lines = []
+        parts = []
         domain_name = data.get('ldhName', data.get('unicodeName', 'Ukjent'))
         
-        lines.append(f"{'─' * 56}")
-        lines.append(f"  DOMENE: {domain_name}")
-        lines.append(f"{'─' * 56}")
-        lines.append("")
+        parts.append(f"{RULE}\n  DOMENE: {domain_name}\n{RULE}\n\n")
 
         # Status
         statuses = data.get("status", [])
         if statuses:
-            lines.append(f"  Status      │ {', '.join(statuses)}")
+            parts.append(f"  Status      │ {', '.join(statuses)}\n")
 
         # Hendelser
         for event in data.get("events", []):
-            action = event.get("eventAction", "")
-            date = event.get("eventDate", "")[:10] if event.get("eventDate") else ""
-            if action == "registration":
-                lines.append(f"  Registrert  │ {date}")
-            elif action == "last changed":
-                lines.append(f"  Sist endret │ {date}")
-            elif action == "expiration":
-                lines.append(f"  Utløper     │ {date}")
+            label = _DOMAIN_EVENT_LABELS.get(event.get("eventAction", ""))
+            if label:
+                date = (event.get("eventDate") or "")[:10]
+                parts.append(f"{label}{date}\n")
 
         # Navneservere
         nameservers = data.get("nameservers", [])
         if nameservers:
-            lines.append("")
-            lines.append("  NAVNESERVERE")
-            lines.append(f"  {'─' * 40}")
-            for ns in nameservers:
-                lines.append(f"    • {ns.get('ldhName', '')}")
-
-        # Registrar
-        for entity in data.get("entities", []):
-            if "registrar" in entity.get("roles", []):
-                lines.append("")
-                lines.append("  REGISTRAR")
-                lines.append(f"  {'─' * 40}")
-                lines.append(f"    Handle: {entity.get('handle', '')}")
-                vcard = entity.get("vcardArray", [])
-                if len(vcard) > 1:
-                    for item in vcard[1]:
-                        if item[0] == "fn":
-                            lines.append(f"    Navn:   {item[3]}")
-
-        return "\n".join(lines)
+            parts.append(f"\n  NAVNESERVERE\n{SUBRULE}\n")
+            parts.extend(f"    • {ns.get('ldhName', '')}\n" for ns in nameservers)
+
+        # Registrar (domenet har én)
+        registrar = next((entity for entity in data.get("entities", ())
+                          if "registrar" in entity.get("roles", ())), None)
+        if registrar is not None:
+            parts.append(f"\n  REGISTRAR\n{SUBRULE}\n    Handle: {registrar.get('handle', '')}\n")
+            vcard = registrar.get("vcardArray", ())
+            if len(vcard) > 1:
+                fn = next((item for item in vcard[1] if item[0] == "fn"), None)
+                if fn is not None:
+                    parts.append(f"    Navn:   {fn[3]}\n")
+
+        return "".join(parts)
 
     # ========================================================================
     # Entitetsoppslag
@@ -989,86 +1682,77 @@ class NoridGUI(ctk.CTk):
         if not handle:
             return
 
+        if not self._begin(("entity", handle)):
+            return
+
         self.entity_button.configure(state="disabled", text="...")
         self._set_status(f"Slår opp {handle}...")
 
+        as_json = self.entity_json_var.get()
+
         def do_request():
             success, result = self.client.rdap_entity(handle)
-            self.after(0, lambda: self._show_entity_result(handle, success, result))
+            success, text = self._render_safe("entity", handle, success, result, as_json)
+            self.after(0, lambda: self._show_entity_result(handle, success, text, result))
 
-        self._run_in_thread(do_request)
+        return self._run_in_thread(do_request)
 
-    def _show_entity_result(self, handle: str, success: bool, result):
-        """Vis entitetsoppslag-resultat"""
+    def _show_entity_result(self, handle: str, success: bool, result: str, data=None):
+        """Vis entitetsoppslag-resultat (teksten er allerede formatert i arbeidstråden)"""
+        self._inflight.discard(("entity", handle))
         self.entity_button.configure(state="normal", text="Slå opp")
-        self.entity_result.delete("0.0", "end")
 
         if not success:
-            self.entity_result.insert("0.0", f"Feil: {result}")
+            self._shown.pop(self.entity_result, None)
+            self._set_text(self.entity_result, f"Feil: {result}")
             self._set_status("Feil ved oppslag")
             return
 
-        if self.entity_json_var.get():
-            self.entity_result.insert("0.0", json.dumps(result, indent=2, ensure_ascii=False))
-        else:
-            self.entity_result.insert("0.0", self._format_entity(result))
-
+        self._show_view(self.entity_result, "entity", handle, data, result)
         self._set_status(f"Oppslag fullført for {handle}")
 
     def _format_entity(self, data: Dict) -> str:
         """Formater entitetsdata til lesbar tekst"""
-        lines = []
+        parts = []
         handle = data.get('handle', 'Ukjent')
         
-        lines.append(f"{'─' * 56}")
-        lines.append(f"  ENTITET: {handle}")
-        lines.append(f"{'─' * 56}")
-        lines.append("")
+        parts.append(f"{RULE}\n  ENTITET: {handle}\n{RULE}\n\n")
 
         # Roller
         roles = data.get("roles", [])
         if roles:
-            lines.append(f"  Roller      │ {', '.join(roles)}")
+            parts.append(f"  Roller      │ {', '.join(roles)}\n")
 
         # Status
         statuses = data.get("status", [])
         if statuses:
-            lines.append(f"  Status      │ {', '.join(statuses)}")
+            parts.append(f"  Status      │ {', '.join(statuses)}\n")
 
         # vCard
         vcard = data.get("vcardArray", [])
         if len(vcard) > 1:
-            lines.append("")
-            lines.append("  KONTAKTINFO")
-            lines.append(f"  {'─' * 40}")
+            parts.append(f"\n  KONTAKTINFO\n{SUBRULE}\n")
             for item in vcard[1]:
-                if item[0] == "fn":
-                    lines.append(f"    Navn:     {item[3]}")
-                elif item[0] == "org":
-                    lines.append(f"    Org:      {item[3]}")
-                elif item[0] == "email":
-                    lines.append(f"    E-post:   {item[3]}")
-                elif item[0] == "tel":
-                    lines.append(f"    Telefon:  {item[3]}")
+                label = _VCARD_LABELS.get(item[0])
+                if label:
+                    parts.append(f"{label}{item[3]}\n")
                 elif item[0] == "adr" and isinstance(item[3], list):
                     city = item[3][3] if len(item[3]) > 3 else ""
                     country = item[3][6] if len(item[3]) > 6 else ""
                     if city or country:
-                        lines.append(f"    Sted:     {city}, {country}")
+                        parts.append(f"    Sted:     {city}, {country}\n")
 
         # Hendelser
         events = data.get("events", [])
         if events:
-            lines.append("")
+            parts.append("\n")
             for event in events:
-                action = event.get("eventAction", "")
-                date = event.get("eventDate", "")[:10] if event.get("eventDate") else ""
-                if action == "registration":
-                    lines.append(f"  Registrert  │ {date}")
-                elif action == "last changed":
-                    lines.append(f"  Sist endret │ {date}")
+                label = _ENTITY_EVENT_LABELS.get(event.get("eventAction", ""))
+                if label:
+                    date = (event.get("eventDate") or "")[:10]
+                    parts.append(f"{label}{date}\n")
 
-        return "\n".join(lines)
+        return "".join(parts)
 
     # ========================================================================
     # Navneserver
@@ -1079,69 +1763,63 @@ class NoridGUI(ctk.CTk):
         if not query:
             return
 
+        if not self._begin(("ns", query)):
+            return
+
         self.ns_button.configure(state="disabled", text="...")
         self._set_status(f"Søker etter {query}...")
 
+        as_json = self.ns_json_var.get()
+        by_handle = self.ns_mode.get() == "handle"
+
+        kind = "ns" if by_handle else "ns_search"
+
         def do_request():
-            if self.ns_mode.get() == "handle":
+            if by_handle:
                 success, result = self.client.rdap_nameserver(query)
             else:
                 success, result = self.client.rdap_nameserver_search(query)
-            self.after(0, lambda: self._show_ns_result(query, success, result))
+            success, text = self._render_safe(kind, query, success, result, as_json)
+            self.after(0, lambda: self._show_ns_result(query, success, text, result, kind))
 
-        self._run_in_thread(do_request)
+        return self._run_in_thread(do_request)
 
-    def _show_ns_result(self, query: str, success: bool, result):
-        """Vis navneserver-resultat"""
+    def _show_ns_result(self, query: str, success: bool, result: str, data=None, kind: str = "ns"):
+        """Vis navneserver-resultat (teksten er allerede formatert i arbeidstråden)"""
+        self._inflight.discard(("ns", query))
         self.ns_button.configure(state="normal", text="Søk")
-        self.ns_result.delete("0.0", "end")
 
         if not success:
-            self.ns_result.insert("0.0", f"Feil: {result}")
+            self._shown.pop(self.ns_result, None)
+            self._set_text(self.ns_result, f"Feil: {result}")
             self._set_status("Feil ved oppslag")
             return
 
-        if self.ns_json_var.get():
-            self.ns_result.insert("0.0", json.dumps(result, indent=2, ensure_ascii=False))
-        else:
-            if self.ns_mode.get() == "handle":
-                self.ns_result.insert("0.0", self._format_nameserver(result))
-            else:
-                self.ns_result.insert("0.0", self._format_ns_search(result))
-
+        self._show_view(self.ns_result, kind, query, data, result)
         self._set_status(f"Oppslag fullført for {query}")
 
     def _format_nameserver(self, data: Dict) -> str:
         """Formater navneserverdata"""
-        lines = []
+        parts = []
         name = data.get('ldhName', 'Ukjent')
         
-        lines.append(f"{'─' * 56}")
-        lines.append(f"  NAVNESERVER: {name}")
-        lines.append(f"{'─' * 56}")
-        lines.append("")
-        lines.append(f"  Handle      │ {data.get('handle', '')}")
+        parts.append(f"{RULE}\n  NAVNESERVER: {name}\n{RULE}\n\n")
+        parts.append(f"  Handle      │ {data.get('handle', '')}\n")
 
         statuses = data.get("status", [])
         if statuses:
-            lines.append(f"  Status      │ {', '.join(statuses)}")
+            parts.append(f"  Status      │ {', '.join(statuses)}\n")
 
         ips = data.get("ipAddresses", {})
         if ips.get("v4"):
-            lines.append("")
-            lines.append("  IPv4-ADRESSER")
-            lines.append(f"  {'─' * 40}")
-            for ip in ips["v4"]:
-                lines.append(f"    • {ip}")
+            parts.append(f"\n  IPv4-ADRESSER\n{SUBRULE}\n")
+            parts.extend(f"    • {ip}\n" for ip in ips["v4"])
                 
         if ips.get("v6"):
-            lines.append("")
-            lines.append("  IPv6-ADRESSER")
-            lines.append(f"  {'─' * 40}")
-            for ip in ips["v6"]:
-                lines.append(f"    • {ip}")
+            parts.append(f"\n  IPv6-ADRESSER\n{SUBRULE}\n")
+            parts.extend(f"    • {ip}\n" for ip in ips["v6"])
 
-        return "\n".join(lines)
+        return "".join(parts)
 
     def _format_ns_search(self, data: Dict) -> str:
         """Formater navneserver-søkeresultater"""
@@ -1149,21 +1827,15 @@ class NoridGUI(ctk.CTk):
         if not results:
             return "Ingen navneservere funnet."
 
-        lines = []
-        lines.append(f"  Fant {len(results)} navneserver(e)")
-        lines.append(f"{'─' * 56}")
-        lines.append("")
-        lines.append(f"  {'HANDLE':<16} {'NAVN':<28} {'IPv4'}")
-        lines.append(f"  {'─' * 16} {'─' * 28} {'─' * 10}")
+        parts = [f"  Fant {len(results)} navneserver(e)\n{RULE}\n\n{NS_SEARCH_HEADER}\n{NS_SEARCH_RULE}\n"]
 
-        for ns in results:
-            handle = ns.get("handle", "")[:15]
-            name = ns.get("ldhName", "")[:27]
-            ips = ns.get("ipAddresses", {})
-            v4 = ", ".join(ips.get("v4", []))[:20]
-            lines.append(f"  {handle:<16} {name:<28} {v4}")
+        parts.extend(
+            NS_SEARCH_ROW(ns.get("handle", ""), ns.get("ldhName", ""),
+                          ", ".join(ns.get("ipAddresses", {}).get("v4", [])))
+            for ns in results
+        )
 
-        return "\n".join(lines)
+        return "".join(parts)
 
     # ========================================================================
     # Whois
@@ -1174,26 +1846,28 @@ class NoridGUI(ctk.CTk):
         if not domain:
             return
 
+        if not self._begin(("whois", domain)):
+            return
+
         self.whois_button.configure(state="disabled", text="...")
         self._set_status(f"Whois-oppslag for {domain}...")
 
-        def do_request():
-            success, result = self.client.whois(domain)
-            self.after(0, lambda: self._show_whois_result(domain, success, result))
-
-        self._run_in_thread(do_request)
+        return self._run_async(
+            self.client.awhois(domain),
+            lambda success, result: self._show_whois_result(domain, success, result)
+        )
 
     def _show_whois_result(self, domain: str, success: bool, result: str):
         """Vis whois-resultat"""
+        self._inflight.discard(("whois", domain))
         self.whois_button.configure(state="normal", text="Slå opp")
-        self.whois_result.delete("0.0", "end")
 
         if not success:
-            self.whois_result.insert("0.0", f"Feil: {result}")
+            self._set_text(self.whois_result, f"Feil: {result}")
             self._set_status("Feil ved oppslag")
             return
 
-        self.whois_result.insert("0.0", result)
+        self._set_text(self.whois_result, result)
         self._set_status(f"Whois-oppslag fullført for {domain}")
 
     def _run_dns(self):
@@ -1202,44 +1876,49 @@ class NoridGUI(ctk.CTk):
         if not domain:
             return
 
+        if not self._begin(("dns", domain)):
+            return
+
         self.dns_button.configure(state="disabled", text="...")
         self._set_status(f"Henter DNS-records for {domain}...")
 
-        def do_request():
-            success, result = self.client.dns_lookup(domain)
-            self.after(0, lambda: self._show_dns_result(domain, success, result))
+        as_json = self.dns_json_var.get()
 
-        self._run_in_thread(do_request)
+        async def do_request():
+            # Feil her må også gi et svar, ellers blir knappen stående på «...»
+            try:
+                success, result = await self.client.adns_lookup(domain)
+            except Exception as e:
+                success, result = False, f"Uventet feil: {str(e)}"
+            success, text = self._render_safe("dns", domain, success, result, as_json)
+            self.after(0, lambda: self._show_dns_result(domain, success, text, result))
 
-    def _show_dns_result(self, domain: str, success: bool, result):
-        """Vis DNS-resultat"""
+        return asyncio.run_coroutine_threadsafe(do_request(), self.loop)
+
+    def _show_dns_result(self, domain: str, success: bool, result: str, data=None):
+        """Vis DNS-resultat (teksten er allerede formatert i arbeidstråden)"""
+        self._inflight.discard(("dns", domain))
         self.dns_button.configure(state="normal", text="Slå opp")
-        self.dns_result.delete("0.0", "end")
 
         if not success:
-            self.dns_result.insert("0.0", f"Feil: {result}")
+            self._shown.pop(self.dns_result, None)
+            self._set_text(self.dns_result, f"Feil: {result}")
             self._set_status("Feil ved oppslag")
             return
 
-        if self.dns_json_var.get():
-            import json
-            self.dns_result.insert("0.0", json.dumps(result, indent=2, ensure_ascii=False))
-        else:
-            lines = []
-            lines.append(f"DNS Records for {domain}")
-            lines.append("=" * 50)
-            lines.append("")
-            lines.append(f"{'Type':<8} Record")
-            lines.append("-" * 50)
-            
-            for rtype, values in result.items():
-                for value in values:
-                    lines.append(f"{rtype:<8} {value}")
-            
-            self.dns_result.insert("0.0", "\n".join(lines))
-
+        self._show_view(self.dns_result, "dns", domain, data, result)
         self._set_status(f"DNS-oppslag fullført for {domain}")
 
+    def _format_dns(self, domain: str, records: Dict) -> str:
+        """Formater DNS-records som tabell"""
+        parts = [f"DNS Records for {domain}\n{DNS_RULE}\n\n{DNS_HEADER}\n{DNS_SUBRULE}\n"]
+
+        for rtype, values in records.items():
+            prefix = f"{rtype:<8} "
+            parts.extend(f"{prefix}{value}\n" for value in values)
+
+        return "".join(parts)
+
 
 def main():
     app = NoridGUI()
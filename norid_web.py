@@ -11,10 +11,22 @@ Tjenester:
   - Whois: Tradisjonelt domeneoppslag
 """
 
+import atexit
+import gzip
+import hashlib
 import json
 import socket
-from flask import Flask, render_template_string, jsonify, request
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from typing import Optional
+from urllib.parse import urlsplit
+from flask import Flask, Response, jsonify, request
+from flask.json.provider import DefaultJSONProvider
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 # DNS-oppslag
 try:
@@ -24,7 +36,52 @@ except ImportError:
     dns_resolver = None
     DNS_AVAILABLE = False
 
+# HTTP/2 mot RDAP og DoH (httpx med h2), ellers requests
+try:
+    import httpx
+    import h2  # noqa: F401  (kreves av http2=True)
+    HTTPX_AVAILABLE = True
+except ImportError:
+    httpx = None
+    HTTPX_AVAILABLE = False
+
+# Brotli-komprimert forside (valgfritt; gzip brukes ellers)
+try:
+    import brotli
+    BROTLI_AVAILABLE = True
+except ImportError:
+    brotli = None
+    BROTLI_AVAILABLE = False
+
+# Raskere JSON inn og ut (valgfritt)
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    orjson = None
+    ORJSON_AVAILABLE = False
+
+
+class OrjsonProvider(DefaultJSONProvider):
+    """JSON-svar fra API-et serialisert med orjson"""
+
+    def dumps(self, obj, **kwargs) -> str:
+        return orjson.dumps(obj).decode("utf-8")
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+
+def parse_json(content: bytes):
+    """Tolk JSON-svar (med orjson hvis tilgjengelig)"""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(content)
+    return json.loads(content)
+
+
 app = Flask(__name__)
+if ORJSON_AVAILABLE:
+    app.json = OrjsonProvider(app)
 
 # API-konfigurasjon
 RDAP_BASE_URL = "https://rdap.norid.no"
@@ -35,66 +92,355 @@ WHOIS_PORT = 43
 DAS_HOST = "finger.norid.no"
 DAS_TEST_HOST = "finger.test.norid.no"
 DAS_PORT = 79
+SOCKET_TIMEOUT = 10
+SOCKET_RECV_SIZE = 65536
+DNS_RECORD_TYPES = ('A', 'AAAA', 'MX', 'NS', 'TXT', 'CNAME')
+
+# Mellomlagring av oppslag i minnet (sekunder)
+RDAP_CACHE_TTL = 300
+SOCKET_CACHE_TTL = {WHOIS_PORT: 300, DAS_PORT: 60}
+DNS_CACHE_TTL = 300
+NOT_FOUND_CACHE_TTL = 60  # Ukjente domener kan bli registrert når som helst
+CACHE_SIZE = 4096
+NOT_FOUND = "Ikke funnet"
+
+# Felles HTTP-klient, så forbindelser (og TLS) gjenbrukes mellom forespørsler.
+# Flask kjører hver forespørsel i egen tråd, derfor en stor pool per vert.
+HTTP_POOL_SIZE = 32
+HTTP_HEADERS = {"User-Agent": "Norid-Web/1.0.0"}
+
+
+def _http_session():
+    """HTTP-klient med HTTP/2 hvis httpx er installert, ellers requests"""
+    if HTTPX_AVAILABLE:
+        # Samtidige forespørsler mot samme vert deler én TLS-forbindelse
+        return httpx.Client(
+            headers=HTTP_HEADERS,
+            timeout=30,
+            transport=httpx.HTTPTransport(
+                http2=True,
+                retries=2,
+                limits=httpx.Limits(max_connections=HTTP_POOL_SIZE,
+                                    max_keepalive_connections=HTTP_POOL_SIZE),
+            ),
+        )
+    
+    session = requests.Session()
+    session.mount("https://", HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=HTTP_POOL_SIZE,
+        max_retries=Retry(total=2, backoff_factor=0.1, status_forcelist=[502, 503, 504]),
+    ))
+    session.headers.update(HTTP_HEADERS)
+    return session
+
+
+_http = _http_session()
+atexit.register(_http.close)
+if HTTPX_AVAILABLE:
+    HTTP_TIMEOUT_ERROR, HTTP_CONNECT_ERROR = httpx.TimeoutException, httpx.ConnectError
+else:
+    HTTP_TIMEOUT_ERROR, HTTP_CONNECT_ERROR = requests.exceptions.Timeout, requests.exceptions.ConnectionError
+RDAP_HEADERS = {"Accept": "application/rdap+json, application/json"}
+
+# Hvor lenge oppslåtte IP-adresser for whois/DAS gjenbrukes (sekunder).
+# En bakgrunnstråd fornyer dem før de går ut, så oppslag slipper navneoppslaget.
+ADDRESS_CACHE_TTL = 900
+SOCKET_HOSTS = (WHOIS_HOST, WHOIS_TEST_HOST, DAS_HOST, DAS_TEST_HOST)
+_address_cache: dict[str, tuple[float, str]] = {}
+
+
+def _resolve(host: str, refresh: bool = False) -> str:
+    """Slå opp IPv4-adressen til host (mellomlagres i ADDRESS_CACHE_TTL sekunder)"""
+    cached = _address_cache.get(host)
+    if cached and cached[0] > time.monotonic() and not refresh:
+        return cached[1]
+    
+    try:
+        address = socket.getaddrinfo(host, None, socket.AF_INET, socket.SOCK_STREAM)[0][4][0]
+    except socket.gaierror:
+        # Navneoppslaget feilet; bruk forrige adresse hvis vi har en
+        if cached:
+            return cached[1]
+        raise
+    _address_cache[host] = (time.monotonic() + ADDRESS_CACHE_TTL, address)
+    return address
+
+
+def _refresh_addresses():
+    """Hold adressene til whois/DAS-vertene ferske (kjører i bakgrunnen)"""
+    while True:
+        for host in SOCKET_HOSTS:
+            try:
+                _resolve(host, refresh=True)
+            except OSError:
+                pass
+        time.sleep(ADDRESS_CACHE_TTL / 2)
+
+
+def start_address_refresher():
+    """Start bakgrunnstråden som slår opp og fornyer whois/DAS-adressene"""
+    threading.Thread(target=_refresh_addresses, name="norid-resolve", daemon=True).start()
+
+
+# Porter som får en ferdig oppkoblet reserveforbindelse. Bare DAS: whois er
+# strengere rate-begrenset, og en ubrukt forbindelse der er bortkastet kvote.
+SPARE_SOCKET_PORTS = (DAS_PORT,)
+SOCKET_IDLE_TIMEOUT = 60  # Eldre reserveforbindelser kastes
+_spare_sockets: dict[tuple[str, int], tuple[float, socket.socket]] = {}
+_spare_lock = threading.Lock()
+_spare_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="norid-spare")
+
+# Mellomlagrede svar: nøkkel -> (utløpstid, svar)
+_cache = OrderedDict()
+_cache_lock = threading.Lock()
+_inflight: dict[tuple, Future] = {}  # Oppslag som pågår akkurat nå
+INFLIGHT_WAIT_TIMEOUT = 30  # Så lenge venter en tråd på et likt oppslag som pågår
+
+
+def _cache_get(key: tuple):
+    """Hent et mellomlagret svar (None hvis det mangler eller er utløpt)"""
+    with _cache_lock:
+        entry = _cache.get(key)
+        if entry is None:
+            return None
+        expires, result = entry
+        if time.monotonic() >= expires:
+            del _cache[key]
+            return None
+        _cache.move_to_end(key)
+        return result
+
+
+def _cached(key: tuple, ttl: float, func):
+    """Returner mellomlagret svar, eller kall func og lagre svaret
+
+    Vellykkede svar lagres i ttl sekunder, «Ikke funnet» kortere, og
+    andre feil (timeout, rate-limit osv.) ikke i det hele tatt. Ber flere
+    tråder om samme svar samtidig, er det bare den første som gjør
+    oppslaget; de andre venter på resultatet (høyst INFLIGHT_WAIT_TIMEOUT
+    sekunder, så et oppslag som henger ikke binder opp alle trådene).
+    """
+    result = _cache_get(key)
+    if result is not None:
+        return result
+
+    with _cache_lock:
+        future = _inflight.get(key)
+        leader = future is None
+        if leader:
+            future = _inflight[key] = Future()
+    if not leader:
+        try:
+            return future.result(timeout=INFLIGHT_WAIT_TIMEOUT)
+        except FutureTimeoutError:
+            return {"success": False, "error": "Timeout"}
+
+    try:
+        result = func()
+        _cache_set(key, result, ttl)
+    except BaseException as e:
+        future.set_exception(e)
+        raise
+    else:
+        future.set_result(result)
+    finally:
+        with _cache_lock:
+            del _inflight[key]
+    return result
+
+
+def _cache_set(key: tuple, result: dict, ttl: float):
+    """Lagre et svar (vellykket, eller «Ikke funnet» i kortere tid)"""
+    if not result["success"]:
+        if result.get("error") != NOT_FOUND:
+            return
+        ttl = min(ttl, NOT_FOUND_CACHE_TTL)
+
+    with _cache_lock:
+        _cache[key] = (time.monotonic() + ttl, result)
+        _cache.move_to_end(key)
+        if len(_cache) > CACHE_SIZE:
+            _cache.popitem(last=False)
+
+
+def clear_cache() -> int:
+    """Tøm mellomlageret; returnerer antall svar som ble fjernet"""
+    with _cache_lock:
+        count = len(_cache)
+        _cache.clear()
+    return count
 
 
 def rdap_request(endpoint: str, use_test: bool = False):
+    """Utfør RDAP-forespørsel, via cache"""
+    return _cached(("rdap", use_test, endpoint), RDAP_CACHE_TTL,
+                   lambda: _rdap_fetch(endpoint, use_test))
+
+
+def _rdap_fetch(endpoint: str, use_test: bool = False):
     """Utfør RDAP-forespørsel"""
     base_url = RDAP_TEST_URL if use_test else RDAP_BASE_URL
     url = f"{base_url}/{endpoint}"
     
     try:
-        response = requests.get(url, timeout=30, headers={
-            "Accept": "application/rdap+json, application/json",
-            "User-Agent": "Norid-Web/1.0.0"
-        })
+        response = _http.get(url, timeout=30, headers=RDAP_HEADERS)
         
         if response.status_code == 200:
-            return {"success": True, "data": response.json()}
+            return {"success": True, "data": parse_json(response.content)}
         elif response.status_code == 404:
-            return {"success": False, "error": "Ikke funnet"}
+            return {"success": False, "error": NOT_FOUND}
         elif response.status_code == 429:
             return {"success": False, "error": "Rate-limit overskredet"}
         else:
             return {"success": False, "error": f"Feil ({response.status_code})"}
-    except requests.exceptions.Timeout:
+    except HTTP_TIMEOUT_ERROR:
         return {"success": False, "error": "Timeout"}
-    except requests.exceptions.ConnectionError:
+    except HTTP_CONNECT_ERROR:
         return {"success": False, "error": "Kunne ikke koble til"}
     except Exception as e:
         return {"success": False, "error": str(e)}
 
 
 def socket_request(host: str, port: int, query: str):
-    """Utfør socket-forespørsel"""
+    """Utfør socket-forespørsel, via cache"""
+    return _cached(("socket", host, port, query), SOCKET_CACHE_TTL[port],
+                   lambda: _socket_fetch(host, port, query))
+
+
+def _socket_fetch(host: str, port: int, query: str):
+    """Utfør socket-forespørsel; hele forespørselen må bli ferdig innen SOCKET_TIMEOUT
+
+    Whois og DAS lukker forbindelsen etter hvert svar, så i stedet for å
+    gjenbruke den åpnes en ny DAS-forbindelse i bakgrunnen, klar til neste
+    oppslag.
+    """
+    deadline = time.monotonic() + SOCKET_TIMEOUT
     try:
-        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
-            sock.settimeout(10)
-            sock.connect((host, port))
-            sock.sendall(f"{query}\r\n".encode("utf-8"))
-            
-            response = b""
-            while True:
-                data = sock.recv(4096)
-                if not data:
-                    break
-                response += data
-            
-            return {"success": True, "data": response.decode("utf-8", errors="replace")}
+        sock = _take_spare(host, port)
+        if sock is not None:
+            try:
+                response = _exchange(sock, query, deadline)
+            except socket.timeout:
+                raise
+            except OSError:
+                # Reserveforbindelsen var død; prøv med en ny
+                pass
+            else:
+                _prepare_spare(host, port)
+                return {"success": True, "data": response}
+        
+        response = _exchange(_connect(host, port), query, deadline)
+        _prepare_spare(host, port)
+        return {"success": True, "data": response}
     except socket.timeout:
         return {"success": False, "error": "Timeout"}
     except socket.error:
+        # Adressen kan ha endret seg; slå opp på nytt neste gang
+        _address_cache.pop(host, None)
         return {"success": False, "error": "socket_error"}
 
 
+def _connect(host: str, port: int) -> socket.socket:
+    """Åpne TCP-forbindelse mot whois/DAS-serveren"""
+    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    try:
+        sock.settimeout(SOCKET_TIMEOUT)
+        sock.connect((_resolve(host), port))
+        # Spørringen er én kort linje; send den uten å vente på Nagle
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+    except OSError:
+        sock.close()
+        raise
+    return sock
+
+
+def _exchange(sock: socket.socket, query: str, deadline: float) -> str:
+    """Send spørring og les svaret til serveren lukker forbindelsen (innen deadline)"""
+    with sock:
+        sock.settimeout(max(deadline - time.monotonic(), 0.001))
+        sock.sendall(f"{query}\r\n".encode("utf-8"))
+        
+        # Les rett inn i én buffer, uten et nytt bytes-objekt per bit
+        response = bytearray()
+        buffer = memoryview(bytearray(SOCKET_RECV_SIZE))
+        while True:
+            # Fristen gjelder hele svaret, ikke hver enkelt recv()
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise socket.timeout()
+            sock.settimeout(remaining)
+            size = sock.recv_into(buffer)
+            if not size:
+                break
+            response += buffer[:size]
+        
+        return response.decode("utf-8", errors="replace")
+
+
+def _take_spare(host: str, port: int) -> Optional[socket.socket]:
+    """Hent reserveforbindelsen til host:port hvis den fortsatt er åpen"""
+    with _spare_lock:
+        entry = _spare_sockets.pop((host, port), None)
+    if entry is None:
+        return None
+    
+    parked, sock = entry
+    if time.monotonic() - parked > SOCKET_IDLE_TIMEOUT or not _socket_alive(sock):
+        sock.close()
+        return None
+    return sock
+
+
+def _prepare_spare(host: str, port: int):
+    """Åpne en reserveforbindelse i bakgrunnen (bare for SPARE_SOCKET_PORTS)"""
+    if port in SPARE_SOCKET_PORTS:
+        _spare_pool.submit(_park_spare, host, port)
+
+
+def _park_spare(host: str, port: int):
+    """Koble til og legg forbindelsen klar for neste oppslag"""
+    try:
+        sock = _connect(host, port)
+    except OSError:
+        return
+    
+    with _spare_lock:
+        old = _spare_sockets.get((host, port))
+        _spare_sockets[(host, port)] = (time.monotonic(), sock)
+    if old is not None:
+        old[1].close()
+
+
+def _socket_alive(sock: socket.socket) -> bool:
+    """Sjekk at en ubrukt forbindelse fortsatt er åpen (uten å lese data)"""
+    try:
+        sock.setblocking(False)
+        try:
+            # Tom lesing betyr at serveren har lukket; data betyr noe uventet
+            sock.recv(1, socket.MSG_PEEK)
+            return False
+        finally:
+            sock.settimeout(SOCKET_TIMEOUT)
+    except BlockingIOError:
+        return True
+    except OSError:
+        return False
+
+
 def rdap_check_available(domain: str, use_test: bool = False):
+    """Sjekk om domene er ledig via RDAP HEAD-request, via cache"""
+    return _cached(("available", use_test, domain), SOCKET_CACHE_TTL[DAS_PORT],
+                   lambda: _rdap_check_available(domain, use_test))
+
+
+def _rdap_check_available(domain: str, use_test: bool = False):
     """Sjekk om domene er ledig via RDAP HEAD-request"""
     base_url = RDAP_TEST_URL if use_test else RDAP_BASE_URL
     url = f"{base_url}/domain/{domain}"
     
     try:
-        response = requests.head(url, timeout=10, headers={
-            "User-Agent": "Norid-Web/1.0.0"
-        })
+        response = _http.head(url, timeout=10)
         
         if response.status_code == 200:
             return {"success": True, "data": "registered"}
@@ -106,36 +452,90 @@ def rdap_check_available(domain: str, use_test: bool = False):
         return {"success": False, "error": str(e)}
 
 
+def rdap_summary(data: dict) -> dict:
+    """Plukk ut feltene oversikten viser (datoer, status, navneservere, registrar)"""
+    registrars = []
+    for entity in data.get("entities", []):
+        if "registrar" not in entity.get("roles", []):
+            continue
+        vcard = entity.get("vcardArray") or []
+        names = [item for item in (vcard[1] if len(vcard) > 1 else []) if item[0] == "fn"]
+        registrars.append({
+            "handle": entity.get("handle", ""),
+            "roles": entity["roles"],
+            "vcardArray": ["vcard", names],
+        })
+    
+    return {
+        "events": [{"eventAction": e.get("eventAction"), "eventDate": e.get("eventDate")}
+                   for e in data.get("events", [])],
+        "status": data.get("status", []),
+        "nameservers": [{"ldhName": ns.get("ldhName", "")} for ns in data.get("nameservers", [])],
+        "entities": registrars,
+    }
+
+
+def das_lookup(domain: str, use_test: bool = False):
+    """Sjekk om domene er ledig via DAS, med RDAP som fallback"""
+    # Prøv socket først, fallback til RDAP
+    host = DAS_TEST_HOST if use_test else DAS_HOST
+    result = socket_request(host, DAS_PORT, domain)
+    
+    if not result["success"] and result.get("error") == "socket_error":
+        # Fallback til RDAP HEAD-request
+        return rdap_check_available(domain, use_test)
+    
+    return result
+
+
+def _dns_resolve(domain: str, rtype: str):
+    """Slå opp én record-type med dnspython (None hvis den mangler)"""
+    try:
+        answers = dns_resolver.resolve(domain, rtype)
+        return [str(r) for r in answers]
+    except (dns_resolver.NXDOMAIN, dns_resolver.NoNameservers):
+        raise
+    except Exception:
+        return None
+
+
+def _doh_resolve(domain: str, rtype: str):
+    """Fallback: slå opp én record-type via Google DNS-over-HTTPS"""
+    try:
+        url = f"https://dns.google/resolve?name={domain}&type={rtype}"
+        response = _http.get(url, timeout=10)
+        if response.status_code == 200:
+            data = parse_json(response.content)
+            if data.get("Answer"):
+                return [a["data"] for a in data["Answer"]]
+    except Exception:
+        pass
+    return None
+
+
+def _resolve_all(domain: str, resolve):
+    """Kjør resolve(domain, rtype) for alle record-typer samtidig, i fast rekkefølge"""
+    with ThreadPoolExecutor(max_workers=len(DNS_RECORD_TYPES)) as executor:
+        answers = executor.map(lambda rtype: resolve(domain, rtype), DNS_RECORD_TYPES)
+        return {rtype: answer for rtype, answer in zip(DNS_RECORD_TYPES, answers) if answer}
+
+
 def dns_lookup(domain: str):
+    """Hent DNS-records for et domene, via cache"""
+    return _cached(("dns", domain.lower()), DNS_CACHE_TTL, lambda: _dns_lookup(domain))
+
+
+def _dns_lookup(domain: str):
     """Hent DNS-records for et domene"""
-    records = {}
-    record_types = ['A', 'AAAA', 'MX', 'NS', 'TXT', 'CNAME']
-    
     if DNS_AVAILABLE and dns_resolver:
-        for rtype in record_types:
-            try:
-                answers = dns_resolver.resolve(domain, rtype)
-                records[rtype] = [str(r) for r in answers]
-            except dns_resolver.NoAnswer:
-                pass
-            except dns_resolver.NXDOMAIN:
-                return {"success": False, "error": f"Domenet {domain} finnes ikke"}
-            except dns_resolver.NoNameservers:
-                return {"success": False, "error": f"Ingen navneservere svarer for {domain}"}
-            except Exception:
-                pass
+        try:
+            records = _resolve_all(domain, _dns_resolve)
+        except dns_resolver.NXDOMAIN:
+            return {"success": False, "error": f"Domenet {domain} finnes ikke"}
+        except dns_resolver.NoNameservers:
+            return {"success": False, "error": f"Ingen navneservere svarer for {domain}"}
     else:
-        # Fallback: Google DNS-over-HTTPS
-        for rtype in record_types:
-            try:
-                url = f"https://dns.google/resolve?name={domain}&type={rtype}"
-                response = requests.get(url, timeout=10)
-                if response.status_code == 200:
-                    data = response.json()
-                    if data.get("Answer"):
-                        records[rtype] = [a["data"] for a in data["Answer"]]
-            except Exception:
-                pass
+        records = _resolve_all(domain, _doh_resolve)
     
     if not records:
         return {"success": False, "error": "Ingen DNS-records funnet"}
@@ -1136,20 +1536,14 @@ HTML_TEMPLATE = '''
             dnsBox.innerHTML = '<div class="loading-placeholder"><div class="loading-spinner"></div><span>Henter DNS...</span></div>';
             
             try {
-                // Kjør alle oppslag parallelt
-                const [dasData, domainData, dnsData] = await Promise.all([
-                    apiCall('das', { domain }),
-                    apiCall('domain', { domain }),
-                    apiCall('dns', { domain })
-                ]);
+                // Alle oppslag kjøres parallelt på serveren
+                const overview = await apiCall('overview', { domain });
+                if (!overview.success) throw new Error(overview.error);
+                const { das: dasData, domain: domainData, dns: dnsData } = overview.data;
                 
                 // Vis DAS-status
                 if (dasData.success) {
-                    const text = String(dasData.data).toLowerCase();
-                    const isAvailable = (text.includes('available') && !text.includes('not available')) 
-                                     || text.includes('not registered');
-                    
-                    if (isAvailable) {
+                    if (isDasAvailable(dasData.data)) {
                         statusCard.className = 'das-result available';
                         statusCard.querySelector('.icon').textContent = '✓';
                         statusCard.querySelector('.status').textContent = 'LEDIG for registrering';
@@ -1269,6 +1663,14 @@ HTML_TEMPLATE = '''
             return response.json();
         }
 
+        // DAS-nøkkelord, gjenkjent i én passering; «not available» står før «available»
+        const DAS_KEYWORDS_RE = /not available|not registered|available/g;
+
+        function isDasAvailable(text) {
+            const found = new Set(String(text).toLowerCase().match(DAS_KEYWORDS_RE));
+            return (found.has('available') && !found.has('not available')) || found.has('not registered');
+        }
+
         // DAS
         async function runDas(e) {
             e.preventDefault();
@@ -1292,11 +1694,7 @@ HTML_TEMPLATE = '''
                 result.querySelector('.domain').textContent = domain;
                 
                 if (data.success) {
-                    const text = data.data.toLowerCase();
-                    const isAvailable = (text.includes('available') && !text.includes('not available')) 
-                                     || text.includes('not registered');
-                    
-                    if (isAvailable) {
+                    if (isDasAvailable(data.data)) {
                         result.className = 'das-result available';
                         result.querySelector('.icon').textContent = '✓';
                         result.querySelector('.status').textContent = 'Dette domenet er LEDIG';
@@ -1439,6 +1837,14 @@ HTML_TEMPLATE = '''
             btn.textContent = 'Slå opp';
         }
 
+        // Etiketter for vCard-felt, slått opp med ett oppslag per felt
+        const VCARD_LABELS = {
+            fn: '    Navn:     ',
+            org: '    Org:      ',
+            email: '    E-post:   ',
+            tel: '    Telefon:  ',
+        };
+
         function formatEntity(data) {
             let lines = [];
             
@@ -1456,11 +1862,9 @@ HTML_TEMPLATE = '''
                 lines.push('  ' + '─'.repeat(40));
                 
                 data.vcardArray[1].forEach(item => {
-                    if (item[0] === 'fn') lines.push(`    Navn:     ${item[3]}`);
-                    if (item[0] === 'org') lines.push(`    Org:      ${item[3]}`);
-                    if (item[0] === 'email') lines.push(`    E-post:   ${item[3]}`);
-                    if (item[0] === 'tel') lines.push(`    Telefon:  ${item[3]}`);
-                    if (item[0] === 'adr' && Array.isArray(item[3])) {
+                    const label = VCARD_LABELS[item[0]];
+                    if (label) lines.push(label + item[3]);
+                    else if (item[0] === 'adr' && Array.isArray(item[3])) {
                         const city = item[3][3] || '';
                         const country = item[3][6] || '';
                         if (city || country) lines.push(`    Sted:     ${city}, ${country}`);
@@ -1658,10 +2062,42 @@ HTML_TEMPLATE = '''
 </html>
 '''
 
+# Malen har ingen variabler, så den rendres (og komprimeres) én gang ved oppstart
+INDEX_HTML = app.jinja_env.from_string(HTML_TEMPLATE).render().encode("utf-8")
+INDEX_VARIANTS = {"gzip": gzip.compress(INDEX_HTML, 9)}
+if BROTLI_AVAILABLE:
+    INDEX_VARIANTS["br"] = brotli.compress(INDEX_HTML, quality=11)
+INDEX_ETAG = hashlib.sha1(INDEX_HTML).hexdigest()
+INDEX_CACHE_CONTROL = "public, max-age=3600"
+
+# API-svar kan gjenbrukes av nettleseren en stund; feil bare noen sekunder
+API_CACHE_CONTROL = "public, max-age=60, stale-while-revalidate=120"
+API_ERROR_CACHE_CONTROL = "max-age=5"
+
+
+def api_response(result: dict, cacheable: Optional[bool] = None):
+    """JSON-svar med Cache-Control og ETag (304 hvis nettleseren har samme svar)"""
+    if cacheable is None:
+        cacheable = result["success"]
+    response = jsonify(result)
+    response.headers["Cache-Control"] = API_CACHE_CONTROL if cacheable else API_ERROR_CACHE_CONTROL
+    response.add_etag()
+    return response.make_conditional(request)
+
 
 @app.route('/')
 def index():
-    return render_template_string(HTML_TEMPLATE)
+    # Foretrekk br, så gzip, ellers ukomprimert
+    encoding = next((e for e in ("br", "gzip")
+                     if e in INDEX_VARIANTS and request.accept_encodings[e]), None)
+    response = Response(INDEX_VARIANTS.get(encoding, INDEX_HTML), mimetype="text/html")
+    if encoding:
+        response.headers["Content-Encoding"] = encoding
+    response.headers["Vary"] = "Accept-Encoding"
+    response.headers["Cache-Control"] = INDEX_CACHE_CONTROL
+    # Én ETag per variant, siden bytene er forskjellige
+    response.set_etag(f"{INDEX_ETAG}-{encoding}" if encoding else INDEX_ETAG)
+    return response.make_conditional(request)
 
 
 @app.route('/api/das')
@@ -1670,18 +2106,32 @@ def api_das():
     env = request.args.get('env', 'prod')
     
     if not domain:
-        return jsonify({"success": False, "error": "Mangler domene"})
+        return api_response({"success": False, "error": "Mangler domene"})
     
-    # Prøv socket først, fallback til RDAP
-    host = DAS_TEST_HOST if env == 'test' else DAS_HOST
-    result = socket_request(host, DAS_PORT, domain)
+    return api_response(das_lookup(domain, env == 'test'))
+
+
+@app.route('/api/overview')
+def api_overview():
+    domain = request.args.get('domain', '')
+    env = request.args.get('env', 'prod')
     
-    if not result["success"] and result.get("error") == "socket_error":
-        # Fallback til RDAP HEAD-request
-        rdap_result = rdap_check_available(domain, env == 'test')
-        return jsonify(rdap_result)
+    if not domain:
+        return api_response({"success": False, "error": "Mangler domene"})
     
-    return jsonify(result)
+    # DAS, RDAP og DNS hentes samtidig, i ett kall fra nettleseren
+    use_test = env == 'test'
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        das = executor.submit(das_lookup, domain, use_test)
+        rdap = executor.submit(rdap_request, f"domain/{domain}", use_test)
+        dns = executor.submit(dns_lookup, domain)
+        parts = {"das": das.result(), "domain": rdap.result(), "dns": dns.result()}
+    
+    # Send bare det oversikten viser, ikke hele RDAP-svaret
+    if parts["domain"]["success"]:
+        parts["domain"] = {"success": True, "data": rdap_summary(parts["domain"]["data"])}
+    return api_response({"success": True, "data": parts},
+                        cacheable=all(part["success"] for part in parts.values()))
 
 
 @app.route('/api/domain')
@@ -1690,9 +2140,9 @@ def api_domain():
     env = request.args.get('env', 'prod')
     
     if not domain:
-        return jsonify({"success": False, "error": "Mangler domene"})
+        return api_response({"success": False, "error": "Mangler domene"})
     
-    return jsonify(rdap_request(f"domain/{domain}", env == 'test'))
+    return api_response(rdap_request(f"domain/{domain}", env == 'test'))
 
 
 @app.route('/api/entity')
@@ -1701,9 +2151,9 @@ def api_entity():
     env = request.args.get('env', 'prod')
     
     if not handle:
-        return jsonify({"success": False, "error": "Mangler handle"})
+        return api_response({"success": False, "error": "Mangler handle"})
     
-    return jsonify(rdap_request(f"entity/{handle}", env == 'test'))
+    return api_response(rdap_request(f"entity/{handle}", env == 'test'))
 
 
 @app.route('/api/nameserver')
@@ -1712,9 +2162,9 @@ def api_nameserver():
     env = request.args.get('env', 'prod')
     
     if not query:
-        return jsonify({"success": False, "error": "Mangler query"})
+        return api_response({"success": False, "error": "Mangler query"})
     
-    return jsonify(rdap_request(f"nameserver_handle/{query}", env == 'test'))
+    return api_response(rdap_request(f"nameserver_handle/{query}", env == 'test'))
 
 
 @app.route('/api/nameserver_search')
@@ -1723,9 +2173,9 @@ def api_nameserver_search():
     env = request.args.get('env', 'prod')
     
     if not query:
-        return jsonify({"success": False, "error": "Mangler query"})
+        return api_response({"success": False, "error": "Mangler query"})
     
-    return jsonify(rdap_request(f"nameservers?name={query}", env == 'test'))
+    return api_response(rdap_request(f"nameservers?name={query}", env == 'test'))
 
 
 @app.route('/api/whois')
@@ -1734,7 +2184,7 @@ def api_whois():
     env = request.args.get('env', 'prod')
     
     if not domain:
-        return jsonify({"success": False, "error": "Mangler domene"})
+        return api_response({"success": False, "error": "Mangler domene"})
     
     # Prøv socket først, fallback til RDAP
     host = WHOIS_TEST_HOST if env == 'test' else WHOIS_HOST
@@ -1764,10 +2214,20 @@ def api_whois():
                 if 'registrar' in entity.get('roles', []):
                     lines.append(f"Registrar: {entity.get('handle', '')}")
             
-            return jsonify({"success": True, "data": "\n".join(lines)})
-        return jsonify(rdap_result)
+            return api_response({"success": True, "data": "\n".join(lines)})
+        return api_response(rdap_result)
     
-    return jsonify(result)
+    return api_response(result)
+
+
+@app.route('/api/cache/flush', methods=['POST'])
+def api_cache_flush():
+    # Et skjema på en annen side kan ikke sette egne headere, og Origin må være denne serveren
+    origin = request.headers.get("Origin")
+    if (request.headers.get("X-Requested-With") != "norid"
+            or (origin is not None and urlsplit(origin).netloc != request.host)):
+        return jsonify({"success": False, "error": "Ikke tillatt"}), 403
+    return jsonify({"success": True, "data": clear_cache()})
 
 
 @app.route('/api/dns')
@@ -1775,9 +2235,9 @@ def api_dns():
     domain = request.args.get('domain', '')
     
     if not domain:
-        return jsonify({"success": False, "error": "Mangler domene"})
+        return api_response({"success": False, "error": "Mangler domene"})
     
-    return jsonify(dns_lookup(domain))
+    return api_response(dns_lookup(domain))
 
 
 def main():
@@ -1786,7 +2246,9 @@ def main():
     print("  Norid Web GUI")
     print("  http://localhost:8080")
     print("="*50 + "\n")
-    app.run(debug=True, port=8080)
+    start_address_refresher()
+    # Én tråd per forespørsel, så et tregt RDAP-oppslag ikke holder igjen de andre
+    app.run(debug=True, port=8080, threaded=True)
 
 
 if __name__ == '__main__':
@@ -0,0 +1,106 @@
+"""Tester for oppdeling av DAS-svar og pipelining i das_many"""
+import pytest
+
+import norid_cli
+from norid_cli import classify_das, das_response_domain, split_das_responses
+
+# Innledningen Norid sender foran hvert DAS-svar (finger.norid.no, port 79)
+HEADER = (
+    "% By looking up information in the domain registration directory\n"
+    "% service, you confirm that you accept the terms and conditions of the\n"
+    "% service:\n"
+    "% https://www.norid.no/en/domeneoppslag/vilkar/\n"
+    "%\n"
+    "% Norid AS holds the copyright to the lookup service, content,\n"
+    "% layout and the underlying collections of information used in the\n"
+    "% service (cf. the Act on Intellectual Property of May 2, 1961, No.\n"
+    "% 2). Any commercial use of information from the service, including\n"
+    "% targeted marketing, is prohibited. Using information from the domain\n"
+    "% registration directory service in violation of the terms and\n"
+    "% conditions may result in legal prosecution.\n"
+    "\n"
+)
+FOOTER = "%\n% Rate limit: see https://www.norid.no/en/domeneoppslag/\n"
+
+
+def reply(domain: str, status: str) -> str:
+    return f"{HEADER}{domain} is {status}\n"
+
+
+def test_single_reply():
+    raw = reply("norid.no", "delegated")
+    assert split_das_responses(raw) == [raw]
+    assert das_response_domain(raw) == "norid.no"
+    assert classify_das(raw) == "taken"
+
+
+def test_pipelined_replies():
+    replies = [reply("norid.no", "delegated"), reply("ledig-eksempel.no", "available"),
+               reply("-ugyldig.no", "invalid")]
+    responses = split_das_responses("".join(replies))
+    assert responses == replies
+    assert [das_response_domain(r) for r in responses] == ["norid.no", "ledig-eksempel.no", "-ugyldig.no"]
+    assert [classify_das(r) for r in responses] == ["taken", "available", "invalid"]
+
+
+def test_replies_with_footer():
+    raw = reply("norid.no", "delegated") + FOOTER + reply("ledig-eksempel.no", "available") + FOOTER
+    responses = split_das_responses(raw)
+    assert len(responses) == 2
+    assert [das_response_domain(r) for r in responses] == ["norid.no", "ledig-eksempel.no"]
+    assert responses[-1].endswith(FOOTER)
+    assert "".join(responses) == raw
+
+
+def test_truncated_reply():
+    raw = reply("norid.no", "delegated") + HEADER[:200]
+    responses = split_das_responses(raw)
+    assert [das_response_domain(r) for r in responses] == ["norid.no"]
+
+
+def test_reply_without_result_names_no_domain():
+    assert das_response_domain(HEADER) is None
+    assert split_das_responses(HEADER) == []
+
+
+@pytest.fixture
+def client(tmp_path, monkeypatch):
+    monkeypatch.setattr(norid_cli, "CACHE_DIR", str(tmp_path))
+    client = norid_cli.NoridClient(use_cache=False)
+    client._taken_file = str(tmp_path / "taken.txt")
+    singles = []
+
+    def single(host, port, query):
+        singles.append(query)
+        return reply(query, "available")
+
+    client.singles = singles
+    monkeypatch.setattr(client, "_socket_request", single)
+    return client
+
+
+def test_das_many_pipelined(client, monkeypatch):
+    monkeypatch.setattr(client, "_socket_query", lambda host, port, query: (
+        reply("norid.no", "delegated") + FOOTER + reply("ledig-eksempel.no", "available")))
+    results = client.das_many(["norid.no", "ledig-eksempel.no"])
+    assert das_response_domain(results["norid.no"]) == "norid.no"
+    assert das_response_domain(results["ledig-eksempel.no"]) == "ledig-eksempel.no"
+    assert client.singles == []
+
+
+def test_das_many_only_first_answered(client, monkeypatch):
+    monkeypatch.setattr(client, "_socket_query", lambda host, port, query: reply("norid.no", "delegated"))
+    results = client.das_many(["norid.no", "ledig-eksempel.no", "annet.no"])
+    assert classify_das(results["norid.no"]) == "taken"
+    assert sorted(client.singles) == ["annet.no", "ledig-eksempel.no"]
+    assert das_response_domain(results["annet.no"]) == "annet.no"
+
+
+def test_das_many_matches_replies_by_domain(client, monkeypatch):
+    # Svarene kommer i en annen rekkefølge enn spørringene, og ett mangler
+    monkeypatch.setattr(client, "_socket_query", lambda host, port, query: (
+        reply("ledig-eksempel.no", "delegated") + reply("norid.no", "delegated")))
+    results = client.das_many(["norid.no", "ledig-eksempel.no", "annet.no"])
+    assert das_response_domain(results["norid.no"]) == "norid.no"
+    assert das_response_domain(results["ledig-eksempel.no"]) == "ledig-eksempel.no"
+    assert client.singles == ["annet.no"]
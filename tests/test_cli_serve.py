@@ -0,0 +1,55 @@
+"""Tester for protokollen til «norid serve»"""
+import socket
+
+import pytest
+
+import norid_cli
+from norid_cli import _read_serve_request, _run_serve_request
+
+
+def _request(payload: bytes, chunk: int = 0):
+    """Send payload (eventuelt i biter) og les den med _read_serve_request"""
+    client, server = socket.socketpair()
+    with client, server:
+        if chunk:
+            for i in range(0, len(payload), chunk):
+                client.sendall(payload[i:i + chunk])
+        else:
+            client.sendall(payload)
+        client.shutdown(socket.SHUT_WR)
+        return _read_serve_request(server)
+
+
+def test_read_request():
+    assert _request(b"1\x002\x00das\x00example.no\x00") == (True, ["das", "example.no"])
+
+
+def test_read_request_in_small_pieces():
+    assert _request(b"0\x002\x00das\x00example.no\x00", chunk=3) == (False, ["das", "example.no"])
+
+
+def test_read_request_short_read():
+    with pytest.raises(ValueError):
+        _request(b"0\x002\x00das\x00exam")
+
+
+def test_read_request_wrong_argument_count():
+    with pytest.raises(ValueError):
+        _request(b"0\x003\x00das\x00example.no\x00")
+    with pytest.raises(ValueError):
+        _request(b"0\x00to\x00das\x00")
+
+
+def test_read_request_non_utf8():
+    color, args = _request(b"0\x001\x00bl\xe5b\xe6r.no\x00")
+    assert not color
+    assert args == ["bl�b�r.no"]
+
+
+def test_run_request_survives_unexpected_errors(monkeypatch):
+    def broken(self, domain, *args, **kwargs):
+        raise RuntimeError("ødelagt svar")
+
+    monkeypatch.setattr(norid_cli.NoridClient, "das", broken)
+    output = _run_serve_request(["--no-cache", "das", "example.no"], False, {})
+    assert "Uventet feil: ødelagt svar" in output
@@ -0,0 +1,25 @@
+"""Sammenlign _simple_table med tabulate «simple»"""
+import pytest
+from tabulate import tabulate
+
+from norid_cli import _nameserver_search_row, _simple_table
+
+HEADERS = ["Handle", "Navn", "IPv4", "IPv6"]
+
+NAMESERVERS = [
+    {"handle": "NSGR123H-NORID", "ldhName": "ns1.example.no",
+     "ipAddresses": {"v4": ["192.0.2.1"], "v6": ["2001:db8::1"]}},
+    {"handle": "NSGR124H-NORID", "ldhName": "ns2.eksempel-med-langt-navn.no",
+     "ipAddresses": {"v4": ["192.0.2.2", "198.51.100.2"],
+                     "v6": ["2001:db8:1234:5678:9abc:def0:1234:5678"]}},
+    {"handle": "NSGR125H-NORID", "ldhName": "ns3.example.no"},
+]
+
+
+@pytest.mark.parametrize("rows", [
+    [],
+    [["A", "b", "", ""]],
+    [_nameserver_search_row(ns) for ns in NAMESERVERS],
+])
+def test_simple_table_matches_tabulate(rows):
+    assert _simple_table(rows, HEADERS) == tabulate(rows, headers=HEADERS, tablefmt="simple")
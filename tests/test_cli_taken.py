@@ -0,0 +1,50 @@
+"""Tester for den lokale listen over kjent registrerte domener"""
+import time
+
+import pytest
+
+import norid_cli
+
+
+@pytest.fixture
+def client(tmp_path, monkeypatch):
+    monkeypatch.setattr(norid_cli, "CACHE_DIR", str(tmp_path))
+    client = norid_cli.NoridClient()
+    client._taken_file = str(tmp_path / "taken.txt")
+    return client
+
+
+def test_remembered_domain_is_taken(client):
+    client.remember_taken("Example.no")
+    assert client.is_known_taken("example.no")
+    assert _reload(client).is_known_taken("example.no")
+
+
+def test_taken_entry_expires(client, monkeypatch):
+    client.remember_taken("example.no")
+    later = time.time() + norid_cli.TAKEN_TTL + 1
+    monkeypatch.setattr(norid_cli.time, "time", lambda: later)
+    assert not client.is_known_taken("example.no")
+
+    # Bekreftes på nytt etter utløp
+    client.remember_taken("example.no")
+    assert client.is_known_taken("example.no")
+
+
+def test_old_format_counts_as_expired(client):
+    with open(client._taken_file, "w", encoding="utf-8") as f:
+        f.write("example.no\n")
+    assert not client.is_known_taken("example.no")
+
+
+def test_no_cache_ignores_list(client):
+    client.remember_taken("example.no")
+    client.use_cache = False
+    assert not client.is_known_taken("example.no")
+
+
+def _reload(client):
+    """Ny klient som leser den samme filen fra disk"""
+    fresh = norid_cli.NoridClient()
+    fresh._taken_file = client._taken_file
+    return fresh